@@ -109,8 +109,14 @@ async def pre():
     async def send_data(server: Server, queue: asyncio.Queue):
         try:
             while True:
-                type, data = await queue.get()
-                await server.broadcast(type, data)
+                batch = [await queue.get()]
+                # 一次取尽已排队的事件, 突发时合并为单个帧发送
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                if len(batch) == 1:
+                    await server.broadcast(*batch[0])
+                else:
+                    await server.broadcast_batch(batch)
         except asyncio.CancelledError:
             pass
 
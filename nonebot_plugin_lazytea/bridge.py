@@ -1,5 +1,6 @@
 import time
 from threading import Lock
+from weakref import WeakKeyDictionary
 import orjson
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 from nonebot import get_driver, logger
@@ -17,12 +18,26 @@ from nonebot_plugin_alconna.uniseg.segment import (
 )
 from nonebot_plugin_uninfo import Uninfo, get_interface
 from nonebot_plugin_uninfo.adapters import alter_get_fetcher
-from .utils.commute import send_event, bot_off_line
+from nonebot_plugin_uninfo.model import BasicInfo
+from .utils.commute import send_event, bot_off_line, is_ui_connected
 from .utils.parse import get_function_fingerprint
 from .utils.roster import FuncTeller, RuleData
 
 driver = get_driver()
 
+_STYLE_MAP: Dict[str, str] = {"bold": "**", "italic": "*",
+                              "strikethrough": "~~", "spoiler": "||", "code": "`"}
+_TYPE_MAP: Dict[type, str] = {Voice: "语音", Audio: "音频", Video: "视频", File: "文件"}
+
+
+# CacheForFingerprint 对函数持有强引用, 因此 id(call) 在进程内不会被复用
+_fingerprint_cache: Dict[Tuple[str, int], str] = {}
+
+# 每次事件处理都会创建新的 Matcher 实例, 随实例回收自动清理
+_matcher_start: "WeakKeyDictionary[Matcher, float]" = WeakKeyDictionary()
+
+_fetcher_cache: Dict[str, Any] = {}
+_baseinfo_cache: Dict[Tuple[str, str], BasicInfo] = {}
 
 _bot_avatar_cache: Dict[str, Optional[str]] = {}
 _bot_avatar_cache_lock = Lock()
@@ -49,8 +64,8 @@ async def fetch_bot_avatar(bot: Bot) -> Optional[str]:
 
 
 def get_bot_avatar(bot_id: str) -> Optional[str]:
-    with _bot_avatar_cache_lock:
-        return _bot_avatar_cache.get(bot_id)
+    # 单次 dict.get 本身是原子的, 每次 API 调用都会读取, 无需加锁
+    return _bot_avatar_cache.get(bot_id)
 
 
 class UniMessageMarkdownConverter:
@@ -81,6 +96,12 @@ class UniMessageMarkdownConverter:
             I18n: self._handle_i18n,
             Other: self._handle_other,
         }
+        # 以 id(类型) 为键, 同时缓存小写类型名, 使每个消息段只需一次查表
+        self._dispatch: Dict[int, Tuple[str, Callable[[Any], str]]] = {
+            id(k): (k.__name__.lower(), v) for k, v in self._handlers.items()
+        }
+        # 未注册的消息段类型同样缓存小写类型名; 以类本身为键, 持有引用避免 id 复用
+        self._default_entries: Dict[type, Tuple[str, Callable[[Any], str]]] = {}
 
     def convert(self, message: Union[UniMessage, str]) -> List[Tuple[str, str]]:
         """
@@ -98,12 +119,24 @@ class UniMessageMarkdownConverter:
         if isinstance(message, str):
             return [("text", self._handle_text(Text(message)))]
 
+        # 绝大多数聊天消息只有一个文本段, 无需构建结果列表与查表
+        if len(message) == 1:
+            segment = message[0]
+            if type(segment) is Text:
+                return [("text", self._handle_text(segment))]
+
+        dispatch = self._dispatch
         result = []
         for segment in message:
-            seg_type = type(segment).__name__.lower()
-            handler = self._handlers.get(type(segment), self._handle_default)
-            md_str = handler(segment)
-            result.append((seg_type, md_str))
+            seg_cls = type(segment)
+            entry = dispatch.get(id(seg_cls))
+            if entry is None:
+                entry = self._default_entries.get(seg_cls)
+                if entry is None:
+                    entry = self._default_entries[seg_cls] = (
+                        seg_cls.__name__.lower(), self._handle_default)
+            seg_type, handler = entry
+            result.append((seg_type, handler(segment)))
 
         return result
 
@@ -111,27 +144,36 @@ class UniMessageMarkdownConverter:
         return f"[{seg.__class__.__name__}]"
 
     def _handle_text(self, seg: Text) -> str:
-        text = seg.text.replace("\n", "  \n")
         if not seg.styles:
-            return text
+            return seg.text.replace("\n", "  \n")
 
-        style_map = {"bold": "**", "italic": "*",
-                     "strikethrough": "~~", "spoiler": "||", "code": "`"}
-
-        sorted_styles = sorted(
-            seg.styles.items(), key=lambda x: (x[0][0], -x[0][1]))
-        parts = list(text)
-        for (start, end), styles in reversed(sorted_styles):
+        text = seg.text
+        length = len(text)
+        # (位置, 0=闭合/1=开启, 次序, 标记): 同一位置先闭合再开启, 内层先闭合, 外层先开启
+        events: List[Tuple[int, int, int, str]] = []
+        for (start, end), styles in seg.styles.items():
             prefix, suffix = "", ""
             for style_name in styles:
-                if mark := style_map.get(style_name):
+                if mark := _STYLE_MAP.get(style_name):
                     prefix += mark
                     suffix = mark + suffix
             if prefix:
-                parts.insert(end, suffix)
-                parts.insert(start, prefix)
-
-        return "".join(parts)
+                start = min(max(start, 0), length)
+                end = min(max(end, start), length)
+                events.append((start, 1, -end, prefix))
+                events.append((end, 0, -start, suffix))
+        events.sort()
+
+        out: List[str] = []
+        cursor = 0
+        for pos, _, _, mark in events:
+            if pos > cursor:
+                out.append(text[cursor:pos])
+                cursor = pos
+            out.append(mark)
+        out.append(text[cursor:])
+
+        return "".join(out).replace("\n", "  \n")
 
     def _handle_at(self, seg: At) -> str:
         return f"**@{seg.display or seg.target}**"
@@ -148,9 +190,8 @@ class UniMessageMarkdownConverter:
         return f"![{alt_text}]({url})"
 
     def _handle_media(self, seg: Union[Voice, Audio, Video, File]) -> str:
-        type_map = {Voice: "语音", Audio: "音频", Video: "视频", File: "文件"}
         seg_type = type(seg)
-        type_name = type_map.get(seg_type, "媒体")
+        type_name = _TYPE_MAP.get(seg_type, "媒体")
 
         if seg_type is File and seg.name != seg.__default_name__:
             return f"[{type_name}: {seg.name}]"
@@ -173,11 +214,18 @@ class UniMessageMarkdownConverter:
     def _handle_button(self, seg: Button) -> str:
         label = seg.label.text if isinstance(
             seg.label, Text) else str(seg.label)
-        flag_map = {
-            "action": f"操作:{seg.id}", "link": f"链接:{seg.url}",
-            "input": f"输入:{seg.text}", "enter": f"发送:{seg.text}",
-        }
-        return f"`{label}` ({flag_map.get(seg.flag, '未知')})"
+        flag = seg.flag
+        if flag == "action":
+            desc = f"操作:{seg.id}"
+        elif flag == "link":
+            desc = f"链接:{seg.url}"
+        elif flag == "input":
+            desc = f"输入:{seg.text}"
+        elif flag == "enter":
+            desc = f"发送:{seg.text}"
+        else:
+            desc = "未知"
+        return f"`{label}` ({desc})"
 
     def _handle_keyboard(self, seg: Keyboard) -> str:
         if not seg.children:
@@ -205,6 +253,9 @@ async def record_event(bot: Bot, event: Event, session: Uninfo):
     if bot.self_id in bot_off_line[session.scope]:
         raise IgnoredException(f"{bot.self_id}已经下线")
 
+    if not is_ui_connected():
+        return
+
     type = event.get_type()
     if type == "message":
 
@@ -247,33 +298,47 @@ async def run_pre(bot: Bot, matcher: Matcher, state: T_State, session: Uninfo):
         logger.debug("消息被LazyTea拦截")
         raise IgnoredException("LazyTea命令开关判断跳过")
 
-    state[f"UI{plugin_name}{hash(matcher)}"] = time.time()
+    _matcher_start[matcher] = time.monotonic()
 
 
 @run_postprocessor
 async def run_post(bot: Bot, matcher: Matcher, exception: Optional[Exception], state: T_State, session: Uninfo):
+    if not is_ui_connected():
+        return
+
     try:
-        current_time = time.time()
+        now = time.monotonic()
         plugin_name = matcher.plugin_name or "Unknown"
-        time_costed = current_time-state[f"UI{plugin_name}{hash(matcher)}"]
+        time_costed = now - _matcher_start.pop(matcher, now)
         group_id = session.scene.id
         user_id = session.user.id
 
-        special = [i.call for i in matcher.handlers]
-        special = [get_function_fingerprint(plugin_name, i) for i in special]
+        special = []
+        for handler in matcher.handlers:
+            key = (plugin_name, id(handler.call))
+            fingerprint = _fingerprint_cache.get(key)
+            if fingerprint is None:
+                fingerprint = _fingerprint_cache[key] = get_function_fingerprint(
+                    plugin_name, handler.call)
+            special.append(fingerprint)
+
+        if exception is None:
+            exc_info = {"name": None, "detail": None}
+        else:
+            exc_info = {"name": type(exception).__name__,
+                        "detail": str(exception)}
 
         data = {
             "bot": bot.self_id,
             "platform": session.scope,
             "adapter": session.adapter,
             "time_costed": time_costed,
-            "time": int(current_time),
+            "time": int(time.time()),
             "groupid": group_id,
             "userid": user_id,
             "plugin": plugin_name,
             "matcher_hash": special,
-            "exception": {"name": type(exception).__name__ if exception else None,
-                          "detail": str(exception) if exception else None}
+            "exception": exc_info
         }
         await send_event("plugin_call", data)
     except Exception as e:
@@ -285,6 +350,9 @@ async def handle_api_call(bot: Bot, api: str, data: Dict[str, Any]):
     # PR welcome
     # 欢迎贡献你使用的适配器的实现
     # 实验性支持，目前已尝试支持ob11/QQApi/telegram
+    if not is_ui_connected():
+        return
+
     avatar = get_bot_avatar(bot.self_id)
 
     if api == "send_msg":
@@ -380,14 +448,32 @@ async def handle_api_call(bot: Bot, api: str, data: Dict[str, Any]):
         # await send_event("call_api", data_to_send)
 
 
+def _get_baseinfo(bot: Bot) -> Optional[BasicInfo]:
+    """按适配器缓存 fetcher, 按 bot 缓存其生命周期内不变的基础信息"""
+    key = (bot.adapter.get_name(), bot.self_id)
+    if key in _baseinfo_cache:
+        return _baseinfo_cache[key]
+
+    adapter_name = key[0]
+    if adapter_name in _fetcher_cache:
+        basefetcher = _fetcher_cache[adapter_name]
+    else:
+        basefetcher = _fetcher_cache[adapter_name] = alter_get_fetcher(
+            adapter_name)
+
+    if not basefetcher:
+        logger.warning(f"不受支持的适配器{adapter_name}")
+        return None
+    baseinfo = _baseinfo_cache[key] = basefetcher.supply_self(bot)
+    return baseinfo
+
+
 @driver.on_bot_connect
 async def track_connect(bot: Bot):
-    basefetcher = alter_get_fetcher(bot.adapter.get_name())
     await fetch_bot_avatar(bot)
-    if not basefetcher:
-        logger.warning(f"不受支持的适配器{bot.adapter.get_name()}")
+    baseinfo = _get_baseinfo(bot)
+    if not baseinfo:
         return
-    baseinfo = basefetcher.supply_self(bot)
 
     data = {
         "bot": baseinfo["self_id"],
@@ -400,11 +486,10 @@ async def track_connect(bot: Bot):
 
 @driver.on_bot_disconnect
 async def track_disconnect(bot: Bot):
-    basefetcher = alter_get_fetcher(bot.adapter.get_name())
-    if not basefetcher:
-        logger.warning(f"不受支持的适配器{bot.adapter.get_name()}")
+    baseinfo = _get_baseinfo(bot)
+    _baseinfo_cache.pop((bot.adapter.get_name(), bot.self_id), None)
+    if not baseinfo:
         return
-    baseinfo = basefetcher.supply_self(bot)
 
     data = {
         "bot": baseinfo["self_id"],
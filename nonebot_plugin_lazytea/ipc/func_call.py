@@ -5,19 +5,21 @@ import sys
 import time
 import orjson
 import aiofiles
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, get_origin
 from pydantic import BaseModel, ValidationError
-from nonebot.plugin import get_loaded_plugins, get_plugin_by_module_name
+from nonebot.plugin import Plugin, get_loaded_plugins, get_plugin_by_module_name
 from nonebot import get_plugin_config as nb_config, logger, get_bot
 
 from .server import Server
 from .models import PluginHTML
 from ..utils.config import _config
-from ..utils.commute import bot_off_line, send_event
+from ..utils.commute import bot_off_line, send_event, set_listening_checker
 from .envhandler import EnvWriter
 from ..utils.roster import FuncTeller
 
-server = Server()
+server = Server(buffer_until_connect=_config.buffer_until_connect)
+set_listening_checker(server.is_listening)
 # 确保 pip 检查和安装过程不会并发执行的锁
 _pip_check_lock = asyncio.Lock()
 # 标记 pip 是否已确认可用
@@ -26,14 +28,23 @@ _pip_available = False
 _active_updates: Set[str] = set()
 # 保护对 _active_updates 集合的并发读写操作
 _active_updates_lock = asyncio.Lock()
+# get_plugins 的结果缓存: (插件数量, 结果)
+_plugins_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+# get_plugin_config 的名称索引: (插件数量, 名称 -> 插件)
+_plugin_name_index: Optional[Tuple[int, Dict[str, Plugin]]] = None
+
+
+@lru_cache(maxsize=None)
+def _schema_for(config: Type[BaseModel]) -> Dict[str, Any]:
+    """配置类的 JSON Schema 在进程内不变，按类缓存"""
+    return config.model_json_schema()
 
 
 def json_config(config: Type[BaseModel]):
-    schema = config.model_json_schema()
     model: BaseModel = nb_config(config)
     data = model.model_dump_json()
     return {
-        "schema": schema,
+        "schema": _schema_for(config),
         "data": data
     }
 
@@ -129,7 +140,12 @@ async def read_files(paths: List[str], keys: Optional[List[str]] = None) -> Dict
 
 @server.register_handler(method="get_plugins")
 def get_plugins():
+    global _plugins_cache
     plugins = get_loaded_plugins()
+    # NoneBot 运行期间插件只增不减, 以插件数量判断缓存是否失效
+    if _plugins_cache is not None and _plugins_cache[0] == len(plugins):
+        return _plugins_cache[1]
+
     plugin_dict = {plugin.name: {"name": plugin.name,
                                  "module": plugin.module_name,
                                  "meta":
@@ -150,7 +166,9 @@ def get_plugins():
                    for plugin in plugins}
 
     plugin_json = orjson.dumps(plugin_dict, default=orjson_default)
-    return orjson.loads(plugin_json)
+    result = orjson.loads(plugin_json)
+    _plugins_cache = (len(plugins), result)
+    return result
 
 
 @server.register_handler(method="get_plugin_config")
@@ -160,8 +178,12 @@ def get_plugin_config(name: str):
     :param name: 插件名称
     :return: 插件配置项
     """
+    global _plugin_name_index
     plugins = get_loaded_plugins()
-    plugin = next((plugin for plugin in plugins if plugin.name == name), None)
+    # 与 get_plugins 一致按 plugin.name 索引, 子插件的 id 为 "parent:child", 不能用 get_plugin
+    if _plugin_name_index is None or _plugin_name_index[0] != len(plugins):
+        _plugin_name_index = (len(plugins), {plugin.name: plugin for plugin in plugins})
+    plugin = _plugin_name_index[1].get(name)
     if plugin is None:
         return {"error": "Plugin not found"}
 
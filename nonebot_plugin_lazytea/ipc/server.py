@@ -1,32 +1,67 @@
 import asyncio
+import itertools
 import time
-from typing import Any, Dict, Callable, Set, List, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, Callable, List, Optional, Set, Tuple
 import uuid
 from nonebot import logger
 from nonebot.drivers import WebSocket
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from ..ui.protocol import ProtocolMessage, MessageHeader, RequestPayload, ResponsePayload
 
+_REQ_ADAPTER = TypeAdapter(RequestPayload)
+_RESP_ADAPTER = TypeAdapter(ResponsePayload)
+
+# 服务端消息 ID 仅用于关联, 进程内唯一即可, 前缀用于区分不同进程实例
+_msg_prefix = uuid.uuid4().hex[:8]
+_msg_counter = itertools.count()
+
+_HEARTBEAT_MARK = b'"msg_type":"heartbeat"'
+_PAYLOAD_MARK = b'"payload"'
+
+
+def _make_header(msg_type: str, correlation_id: Optional[str] = None) -> Dict[str, Any]:
+    """构建消息头字典，服务端生成的字段已知合法，无需经过 MessageHeader 校验"""
+    return {
+        "msg_id": f"{_msg_prefix}-{next(_msg_counter)}",
+        "msg_type": msg_type,
+        "correlation_id": correlation_id,
+        "timestamp": time.time(),
+    }
+
+
 class Server:
-    def __init__(self):
+    SEND_QUEUE_SIZE = 1000
+    TRANSIENT_BUFFER_SIZE = 10000
+
+    def __init__(self, buffer_until_connect: bool = True):
         self.active_connections: Set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        self._writers: Dict[WebSocket,
+                            Tuple["asyncio.Queue[bytes]", asyncio.Task]] = {}
         self.handlers: Dict[str, Callable] = {}
+        # method -> (处理器, 是否为协程函数)，注册时确定，避免每次请求反射判断
+        self._dispatch: Dict[str, Tuple[Callable, bool]] = {}
 
         self.start_time: float = time.time()
         self.has_connected: bool = False
+        self.buffer_until_connect = buffer_until_connect
         self._buffer_lock = asyncio.Lock()
 
         self.bot_status_buffer: Dict[str, Tuple[str, Dict]] = {}
-        self.transient_message_buffer: List[Tuple[str, Dict]] = []
+        self.transient_message_buffer: Deque[Tuple[str, Dict]] = deque(
+            maxlen=self.TRANSIENT_BUFFER_SIZE)
+
+    def is_listening(self) -> bool:
+        """是否有客户端连接, 或仍处于启动后的瞬时消息缓冲期"""
+        return self.has_connected or (
+            self.buffer_until_connect and time.time() - self.start_time < 60)
 
     async def clear_transient_buffer_after_delay(self):
         """一个一次性的后台任务，在60秒后运行，如果瞬时缓冲区仍有数据则清空它。"""
         await asyncio.sleep(60)
-        async with self._buffer_lock:
-            if self.transient_message_buffer:
-                logger.info("启动后60秒窗口期已过，丢弃未发送的瞬时消息。")
-                self.transient_message_buffer.clear()
+        if self.transient_message_buffer:
+            logger.info("启动后60秒窗口期已过，丢弃未发送的瞬时消息。")
+            self.transient_message_buffer.clear()
 
     async def start(self, websocket: WebSocket, token: str) -> None:
         """处理WebSocket"""
@@ -44,26 +79,38 @@ class Server:
         await websocket.accept()
         await self.send_bot_status(websocket)
 
-        is_first_connection = False
-        async with self._lock:
-            if not self.active_connections:
-                is_first_connection = True
+        out_queue: "asyncio.Queue[bytes]" = asyncio.Queue(
+            maxsize=self.SEND_QUEUE_SIZE)
+        writer = asyncio.create_task(self._writer_loop(websocket, out_queue))
 
-            self.active_connections.add(websocket)
-            self.has_connected = True
+        # 以下状态变更之间没有 await，在事件循环中天然原子，无需加锁
+        is_first_connection = not self.active_connections
+        self.active_connections.add(websocket)
+        self._writers[websocket] = (out_queue, writer)
+        self.has_connected = True
 
         if is_first_connection and time.time() - self.start_time < 60:
             asyncio.create_task(self._flush_transient_buffer())
 
         try:
-            buffer = ""
+            separator = ProtocolMessage.SEPARATOR_B
+            buffer = bytearray()
             while True:
-                raw_data = await websocket.receive_text()
+                # 兼容文本帧与二进制帧，统一按字节处理
+                raw_data = await websocket.receive()
+                if isinstance(raw_data, str):
+                    raw_data = raw_data.encode("utf-8")
+                # 只扫描新到达的数据，回退 len(separator) - 1 字节以覆盖跨帧的分隔符
+                scan_from = max(0, len(buffer) - len(separator) + 1)
                 buffer += raw_data
 
-                while ProtocolMessage.SEPARATOR in buffer:
-                    msg, buffer = buffer.split(ProtocolMessage.SEPARATOR, 1)
-                    asyncio.create_task(self._process_message(websocket, msg))
+                start = 0
+                while (end := buffer.find(separator, scan_from)) != -1:
+                    asyncio.create_task(self._process_message(
+                        websocket, bytes(buffer[start:end])))
+                    start = scan_from = end + len(separator)
+                if start:
+                    del buffer[:start]
 
         except:
             logger.debug("Client disconnected")
@@ -78,6 +125,8 @@ class Server:
         def decorator(func: Callable):
             if method not in self.handlers:
                 self.handlers[method] = func
+                self._dispatch[method] = (
+                    func, asyncio.iscoroutinefunction(func))
                 return func
             else:
                 raise RuntimeError(f"UI远程方法 {method} 发生冲突,请更换名称")
@@ -88,6 +137,20 @@ class Server:
         广播方法。
         根据消息类型、服务器运行时间和连接状态来处理消息。
         """
+        await self._buffer_message(message_type, data)
+        if self.has_connected:
+            self._real_broadcast(message_type, data)
+
+    async def broadcast_batch(self, messages: List[Tuple[str, Dict]]) -> None:
+        """批量广播, 多条消息合并为一个 batch 帧发送, 缓冲规则与 broadcast 相同"""
+        for message_type, data in messages:
+            await self._buffer_message(message_type, data)
+        if self.has_connected:
+            self._real_broadcast(
+                "batch", [{"type": message_type, "data": data} for message_type, data in messages])
+
+    async def _buffer_message(self, message_type: str, data: Dict) -> None:
+        """记录bot状态, 或在首个客户端连接前缓冲瞬时消息"""
         if message_type in {"bot_connect", "bot_disconnect"}:
             bot_id = data.get("bot")
             platform = data.get("platform")
@@ -97,23 +160,19 @@ class Server:
                     self.bot_status_buffer[composite_key] = (
                         message_type, data)
 
-        elif not self.has_connected and time.time() - self.start_time < 60:
-            async with self._buffer_lock:
-                self.transient_message_buffer.append((message_type, data))
-
-        if self.has_connected:
-            await self._real_broadcast(message_type, data)
+        elif (not self.has_connected and self.buffer_until_connect
+              and time.time() - self.start_time < 60):
+            # 有界缓冲，超出时丢弃最早的消息
+            self.transient_message_buffer.append((message_type, data))
 
     async def _flush_transient_buffer(self):
         """发送所有在启动初期缓冲的瞬时消息，然后清空缓冲区。"""
-        async with self._buffer_lock:
-            messages_to_flush = self.transient_message_buffer.copy()
-            self.transient_message_buffer.clear()
-
-        if messages_to_flush:
-            logger.info(f"首个客户端连接，发送 {len(messages_to_flush)} 条缓存的瞬时消息。")
-            for msg_type, data in messages_to_flush:
-                await self._real_broadcast(msg_type, data)
+        buffer = self.transient_message_buffer
+        if buffer:
+            logger.info(f"首个客户端连接，发送 {len(buffer)} 条缓存的瞬时消息。")
+            while buffer:
+                msg_type, data = buffer.popleft()
+                self._real_broadcast(msg_type, data)
 
     async def send_bot_status(self, ws: WebSocket):
         """向指定的单个客户端发送当前所有bot的最新状态"""
@@ -122,41 +181,45 @@ class Server:
 
         for msg_type, data in statuses:
             try:
-                header = MessageHeader(
-                    msg_id=str(uuid.uuid4()),
-                    msg_type=msg_type,
-                    timestamp=time.time()
-                )
-                encoded = ProtocolMessage.encode(header, data)
-                await ws.send_text(encoded)
+                encoded = ProtocolMessage.encode_bytes(
+                    _make_header(msg_type), data)
+                await ws.send_bytes(encoded)
             except Exception as e:
                 logger.error(f"向客户端发送bot状态失败: {e}")
 
-    async def _real_broadcast(self, message_type: str, data: Dict) -> None:
-        """实际执行广播的核心方法"""
-        async with self._lock:
-            if not self.active_connections:
-                return
+    def _real_broadcast(self, message_type: str, data: Any) -> None:
+        """实际执行广播的核心方法，仅将编码后的消息投入各连接的发送队列"""
+        if not self._writers:
+            return
 
-            tasks = []
-            header = MessageHeader(
-                msg_id=str(uuid.uuid4()),
-                msg_type=message_type,
-                timestamp=time.time()
-            )
-            encoded = ProtocolMessage.encode(header, data)
+        encoded = ProtocolMessage.encode_bytes(
+            _make_header(message_type), data)
 
-            for ws in list(self.active_connections):
-                try:
-                    tasks.append(ws.send_text(encoded))
-                except Exception as e:
-                    logger.error(f"Broadcast failed: {str(e)}")
+        for out_queue, _ in self._writers.values():
+            try:
+                out_queue.put_nowait(encoded)
+            except asyncio.QueueFull:
+                logger.debug(f"客户端发送队列已满，丢弃 {message_type} 消息")
 
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+    async def _writer_loop(self, ws: WebSocket, out_queue: "asyncio.Queue[bytes]") -> None:
+        """单个连接的发送协程，按序发送广播消息"""
+        try:
+            while True:
+                message = await out_queue.get()
+                await ws.send_bytes(message)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Broadcast failed: {str(e)}")
 
-    async def _process_message(self, ws: WebSocket, raw_data: str) -> None:
+    async def _process_message(self, ws: WebSocket, raw_data: bytes) -> None:
         """处理原始消息"""
+        # 心跳是最频繁的消息, 消息头位于载荷之前, 仅在头部范围内命中即直接响应, 跳过解析与校验
+        header_end = raw_data.find(_PAYLOAD_MARK)
+        if header_end != -1 and raw_data.find(_HEARTBEAT_MARK, 0, header_end) != -1:
+            await self._send_heartbeat(ws)
+            return
+
         try:
             header, payload = ProtocolMessage.decode(raw_data)
             if not header:
@@ -180,16 +243,22 @@ class Server:
     ) -> None:
         """处理请求并返回响应"""
         try:
-            request = RequestPayload(**payload)
-            handler = self.handlers.get(request.method)
-
-            if not handler:
+            # 结构合法时直接取字段, 仅在不合法时经 pydantic 校验以生成错误详情
+            method = payload.get("method") if isinstance(payload, dict) else None
+            params = payload.get("params") if isinstance(payload, dict) else None
+            if not (isinstance(method, str) and isinstance(params, dict)):
+                request = _REQ_ADAPTER.validate_python(payload)
+                method, params = request.method, request.params
+            entry = self._dispatch.get(method)
+
+            if entry is None:
                 response = ResponsePayload(code=404, error="Method not found")
             else:
-                if asyncio.iscoroutinefunction(handler):
-                    result = await handler(**request.params)
+                handler, is_coro = entry
+                if is_coro:
+                    result = await handler(**params)
                 else:
-                    result = handler(**request.params)
+                    result = handler(**params)
                 if isinstance(result, Dict) and result.get("error"):
                     response = ResponsePayload(
                         code=1, error=result.get("error"))
@@ -203,61 +272,50 @@ class Server:
         except Exception as e:
             response = ResponsePayload(code=500, error=str(e))
 
-        response_header = MessageHeader(
-            msg_id=str(uuid.uuid4()),
-            msg_type="response",
-            correlation_id=header.msg_id,
-            timestamp=time.time()
-        )
-        await self._send_response(ws, response_header, response)
+        await self._send_response(
+            ws, _make_header("response", header.msg_id), response)
 
     async def _send_response(
         self,
         ws: WebSocket,
-        header: MessageHeader,
+        header: Dict[str, Any],
         payload: ResponsePayload
     ) -> None:
         """发送响应消息"""
         try:
-            message = ProtocolMessage.encode(header, payload.model_dump())
-            await ws.send_text(message)
+            message = ProtocolMessage.encode_bytes(
+                header, _RESP_ADAPTER.dump_python(payload))
+            await ws.send_bytes(message)
         except Exception as e:
             logger.error(f"Send response failed: {str(e)}")
 
     async def _send_heartbeat(self, ws: WebSocket):
         """处理心跳响应"""
         try:
-            header = MessageHeader(
-                msg_id=str(uuid.uuid4()),
-                msg_type="heartbeat",
-                timestamp=time.time()
-            )
-            await ws.send_text(ProtocolMessage.encode(header, {"status": "alive"}))
+            await ws.send_bytes(ProtocolMessage.encode_bytes(
+                _make_header("heartbeat"), {"status": "alive"}))
         except Exception as e:
             logger.debug(f"Heartbeat failed: {str(e)}")
 
     async def _send_error(self, ws: WebSocket, error: str):
         """发送错误响应"""
         response = ResponsePayload(code=500, error=error)
-        header = MessageHeader(
-            msg_id=str(uuid.uuid4()),
-            msg_type="response",
-            timestamp=time.time()
-        )
-        await self._send_response(ws, header, response)
+        await self._send_response(ws, _make_header("response"), response)
 
     async def _cleanup_connection(self, ws: WebSocket):
         """清理断开连接的客户端"""
-        async with self._lock:
-            if ws in self.active_connections:
-                self.active_connections.remove(ws)
-                if not self.active_connections:
-                    self.has_connected = False
-                try:
-                    if not ws.closed:
-                        await ws.close()
-                except RuntimeError as e:
-                    if "Unexpected ASGI message 'websocket.close'" in str(e):
-                        logger.debug("WebSocket already closed")
-                    else:
-                        raise
+        if ws not in self.active_connections:
+            return
+        self.active_connections.discard(ws)
+        _, writer = self._writers.pop(ws)
+        writer.cancel()
+        if not self.active_connections:
+            self.has_connected = False
+        try:
+            if not ws.closed:
+                await ws.close()
+        except RuntimeError as e:
+            if "Unexpected ASGI message 'websocket.close'" in str(e):
+                logger.debug("WebSocket already closed")
+            else:
+                raise
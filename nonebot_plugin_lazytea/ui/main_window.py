@@ -1,23 +1,26 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 import random
 from types import ModuleType
 import webbrowser
-from typing import Any, ClassVar, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 import sys
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QStackedWidget, QGraphicsOpacityEffect,
     QPushButton, QLabel, QSizePolicy, QSpacerItem, QGraphicsDropShadowEffect, QApplication,
-    QSystemTrayIcon, QMenu, QFrame
+    QSystemTrayIcon, QMenu, QFrame, QGraphicsScene, QGraphicsPixmapItem,
+    QGraphicsBlurEffect
 )
-from PySide6.QtGui import (QPixmap, QColor, QIcon, QFont, QPainter,
+from PySide6.QtGui import (QPixmap, QPixmapCache, QColor, QIcon, QFont, QPainter, QImage, QImageReader,
                            QBrush, QCursor, QPainterPath, QBitmap,
                            QGuiApplication, QEnterEvent,
                            QMouseEvent, QResizeEvent
                            )
 from PySide6.QtCore import (
     Qt, QSize, QPropertyAnimation, QEasingCurve, QPoint,
-    QParallelAnimationGroup, QEvent, Signal, QPointF, QRectF, QTimer
+    QEvent, Signal, QRect, QRectF, QTimer,
+    QObject, QRunnable, QThreadPool, QVariantAnimation, QAbstractAnimation
 )
 
 from .pages.background.start import PluginInit
@@ -101,7 +104,9 @@ def retroactive_aliasing_patch(entry_file_path: str, package_import_prefix: str)
                     f"[retroactive_aliasing_patch] 成功关联: '{original_name}' => '{canonical_name}'")
 
 
+@lru_cache(maxsize=64)
 def create_icon_from_unicode(unicode_char: str, size: int = 24) -> QIcon:
+    """将字符绘制为图标, 结果按 (字符, 尺寸) 缓存, QIcon 隐式共享可直接复用"""
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
     painter = QPainter(pixmap)
@@ -114,130 +119,282 @@ def create_icon_from_unicode(unicode_char: str, size: int = 24) -> QIcon:
     return QIcon(pixmap)
 
 
+_NAV_FONT_SIZE = 14
+# 导航按钮右下方留给阴影的绘制空间
+_NAV_SHADOW_MARGIN = 8
+# 导航按钮背景不透明度, 阴影按按钮自身透明度衰减, 与原投影效果一致
+_NAV_BG_ALPHA = 0.15
+# 主窗口全部样式集中于此, 以 objectName/属性选择器区分控件, 启动时只需设置一次
+_MAIN_WINDOW_QSS = f"""
+    MainWindow {{
+        background: transparent;
+        border: 1px solid rgba(127, 127, 127, 0.3);
+    }}
+
+    #sidebar {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(255, 245, 245, 0.98),
+            stop:1 rgba(255, 255, 255, 0.95));
+        margin: 0px;
+        border-top-left-radius: 15px;
+        border-bottom-left-radius: 15px;
+        border-right: 1px solid rgba(255, 182, 193, 0.35);
+    }}
+
+    #title {{
+        font: bold 28px 'Comic Sans MS';
+        color: #222222;  /* Darker text for better contrast */
+        padding: 24px 0;
+        margin: 16px 0;
+        letter-spacing: 2px;
+    }}
+
+    QLabel#sidebarLine {{
+        background: qlineargradient(x1:0, y1:0.5, x2:1, y2:0.5,
+            stop:0 rgba(255,255,255,0),
+            stop:0.5 rgba(255,255,255,0.9),
+            stop:1 rgba(255,255,255,0));
+    }}
+
+    QLabel#versionLabel {{
+        color: #222222;
+        font: italic 12px 'Comic Sans MS';
+        background: rgba(255, 255, 255, 0.25);
+        border-radius: 12px;
+        padding: 6px 16px;
+        border: 1px solid rgba(255, 255, 255, 0.3);
+    }}
+
+    QWidget#mainStack {{
+        background: white;
+        margin: 0px;
+        border: 2px solid rgba(0, 0, 0, 0.1);
+        border-top-right-radius: 15px;
+        border-bottom-right-radius: 15px;
+    }}
+
+    QPushButton#navButton {{
+        background: rgba(255, 255, 255, {_NAV_BG_ALPHA});
+        color: #333333;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 15px;
+        padding: 12px 20px;
+        margin: 0 {_NAV_SHADOW_MARGIN}px {_NAV_SHADOW_MARGIN}px 0;
+        font: 500 {_NAV_FONT_SIZE}px 'Microsoft YaHei';
+        text-align: left;
+        min-height: {int(_NAV_FONT_SIZE * 2.618)}px;
+    }}
+    QPushButton#navButton:hover {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(255, 255, 255, 0.35),
+            stop:1 rgba(255, 215, 225, 0.3)
+        );
+    }}
+    QPushButton#navButton:checked {{
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(255, 255, 255, 0.45),
+            stop:1 rgba(255, 235, 240, 0.4)
+        );
+        border-color: rgba(255, 255, 255, 0.6);
+        color: #222222;
+    }}
+
+    QPushButton#windowControl {{
+        color: white;
+        font: bold 16px 'Arial';
+        border-radius: 16px;
+        min-width: 32px;
+        max-width: 32px;
+        min-height: 32px;
+        max-height: 32px;
+    }}
+    QPushButton#windowControl[kind="min"] {{
+        background: #FFB6C1;
+    }}
+    QPushButton#windowControl[kind="min"]:hover {{
+        background: qradialgradient(
+            cx:0.5, cy:0.5, radius:0.5,
+            fx:0.5, fy:0.5,
+            stop:0 #FFB6C1,
+            stop:1 rgba(255,255,255,0.4)
+        );
+    }}
+    QPushButton#windowControl[kind="close"] {{
+        background: #FF69B4;
+    }}
+    QPushButton#windowControl[kind="close"]:hover {{
+        background: qradialgradient(
+            cx:0.5, cy:0.5, radius:0.5,
+            fx:0.5, fy:0.5,
+            stop:0 #FF69B4,
+            stop:1 rgba(255,255,255,0.4)
+        );
+    }}
+"""
+
+
+_brand_pixmap: Optional[QPixmap] = None
+
+
+def _get_brand_pixmap() -> QPixmap:
+    """侧边栏品牌图标, 首次使用时绘制后复用"""
+    global _brand_pixmap
+    if _brand_pixmap is None:
+        pixmap = QPixmap(64, 64)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QBrush(QColor(255, 255, 255, 220)))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(0, 0, 64, 64)
+        painter.setFont(QFont("Segoe UI Emoji", 18))
+        painter.setPen(QColor(50, 50, 50))
+        painter.drawText(pixmap.rect(),
+                         Qt.AlignmentFlag.AlignCenter, "🍵")
+        painter.end()
+        _brand_pixmap = pixmap
+    return _brand_pixmap
+
+
+@lru_cache(maxsize=8)
+def _build_mask(width: int, height: int) -> QBitmap:
+    """按窗口尺寸构建圆角遮罩, 同尺寸复用"""
+    bitmap = QBitmap(width, height)
+    bitmap.fill(Qt.GlobalColor.color0)
+
+    painter = QPainter(bitmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(Qt.GlobalColor.color1)
+    painter.drawRoundedRect(QRect(0, 0, width, height).adjusted(
+        1, 1, -1, -1), 15, 15)
+    painter.end()
+    return bitmap
+
+
+def _render_nav_shadow(width: int, height: int, blur: int) -> QPixmap:
+    """绘制圆角矩形阴影, blur 为 0 时为硬边阴影"""
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(100, 100, 100, round(80 * _NAV_BG_ALPHA)))
+    painter.drawRoundedRect(QRectF(0, 0, width, height), 15, 15)
+    painter.end()
+    if blur <= 0:
+        return QPixmap.fromImage(image)
+
+    # 借助场景渲染一次模糊效果, 结果缓存后复用
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    blurred = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    blurred.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(blurred)
+    scene.render(painter, QRectF(0, 0, width, height),
+                 QRectF(0, 0, width, height))
+    painter.end()
+    return QPixmap.fromImage(blurred)
+
+
 class NavButton(QPushButton):
     _BASE_PADDING_RATIO = (0.5, 1.0)
     _ICON_SIZE_RATIO = 2.0
     _ACTIVE_ICON_MULTIPLIER = 1.25
+    _SHADOW_BLUR = 25
+    _SHADOW_OFFSET = (3, 8)
 
     def __init__(self, icon: QIcon, text: str, parent: Optional[QWidget] = None) -> None:
         super().__init__(text, parent)
-        self._base_font_size = 14
+        self._base_font_size = _NAV_FONT_SIZE
         self._base_icon_size = QSize(24, 24)
         self._active_icon_size = QSize(28, 28)
         self._original_pos = QPoint()
+        self._shadow_progress = 0.0
 
         self._init_ui(icon)
         self._setup_animations()
 
     def _init_ui(self, icon: QIcon) -> None:
+        self.setObjectName("navButton")
         self.setCheckable(True)
         self.setSizePolicy(QSizePolicy.Policy.Expanding,
                            QSizePolicy.Policy.Fixed)
         self.setIcon(icon)
         self.setIconSize(self._base_icon_size)
-        self.update_style()
 
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(0)
-        self.shadow.setOffset(3, 3)
-        self.shadow.setColor(QColor(100, 100, 100, 80))
-        self.setGraphicsEffect(self.shadow)
+    @staticmethod
+    def _shadow_pixmap(width: int, height: int, blur: int) -> QPixmap:
+        # 所有按钮共享, 由 QPixmapCache 按容量淘汰, 窗口反复缩放时不会无限增长
+        key = f"lazytea_nav_shadow_{width}x{height}_{blur}"
+        pixmap = QPixmap()
+        if not QPixmapCache.find(key, pixmap):
+            pixmap = _render_nav_shadow(width, height, blur)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
 
     def _setup_animations(self) -> None:
-        self.enter_anim = QParallelAnimationGroup(self)
-
-        self.icon_anim = QPropertyAnimation(self, b"iconSize")
-        self.icon_anim.setDuration(120)
-        self.icon_anim.setEasingCurve(QEasingCurve.Type.OutBack)
-
-        self.shadow_anim = QPropertyAnimation(self.shadow, b"blurRadius")
-        self.shadow_anim.setDuration(120)
-
-        self.pos_anim = QPropertyAnimation(self, b"pos")
-        self.pos_anim.setDuration(120)
-        self.pos_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
-
-        self.enter_anim.addAnimation(self.icon_anim)
-        self.enter_anim.addAnimation(self.shadow_anim)
-        self.enter_anim.addAnimation(self.pos_anim)
-
-        self.shadow_offset_anim = QPropertyAnimation(self.shadow, b"offset")
-        self.shadow_offset_anim.setDuration(120)
-        self.enter_anim.addAnimation(self.shadow_offset_anim)
+        # 单个可逆动画驱动图标、阴影与位移, 进入正放、离开倒放, 中途反向也能平滑衔接
+        self.hover_anim = QVariantAnimation(self)
+        self.hover_anim.setStartValue(0.0)
+        self.hover_anim.setEndValue(1.0)
+        self.hover_anim.setDuration(120)
+        self.hover_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self.hover_anim.valueChanged.connect(self._apply_hover)
+
+    def _apply_hover(self, value: float) -> None:
+        """按悬停进度 0~1 插值图标尺寸、阴影与位置"""
+        self._shadow_progress = value
+        base, active = self._base_icon_size, self._active_icon_size
+        self.setIconSize(QSize(
+            round(base.width() + (active.width() - base.width()) * value),
+            round(base.height() + (active.height() - base.height()) * value)))
+        self.move(self._original_pos + QPoint(round(3 * value), round(-3 * value)))
+        self.update()
+
+    def _play_hover(self, direction: QAbstractAnimation.Direction, target: float) -> None:
+        anim = self.hover_anim
+        anim.setDirection(direction)
+        if anim.state() != QAbstractAnimation.State.Running and self._shadow_progress != target:
+            anim.start()
 
     def enterEvent(self, event: QEnterEvent) -> None:
         super().enterEvent(event)
-        self._original_pos = self.pos()
+        if self.hover_anim.state() != QAbstractAnimation.State.Running and self._shadow_progress == 0.0:
+            self._original_pos = self.pos()
         self.raise_()
-
-        if self.enter_anim.state() == QPropertyAnimation.State.Running:
-            self.enter_anim.stop()
-
-        self.icon_anim.setStartValue(self.iconSize())
-        self.icon_anim.setEndValue(self._active_icon_size)
-
-        self.shadow_anim.setStartValue(0)
-        self.shadow_anim.setEndValue(25)
-        self.shadow_offset_anim.setStartValue(QPointF(3, 3))
-        self.shadow_offset_anim.setEndValue(QPointF(8, 8))
-
-        self.pos_anim.setStartValue(self._original_pos)
-        self.pos_anim.setEndValue(self._original_pos + QPoint(3, -3))
-
-        self.enter_anim.start()
+        self._play_hover(QAbstractAnimation.Direction.Forward, 1.0)
 
     def leaveEvent(self, event: QEvent) -> None:
         super().leaveEvent(event)
-        if self.enter_anim.state() == QPropertyAnimation.State.Running:
-            self.enter_anim.stop()
-
-        self.setIconSize(self._base_icon_size)
-        self.shadow.setOffset(3, 3)
-        self.shadow.setBlurRadius(0)
-        self.move(self._original_pos)
-
-    def update_style(self) -> None:
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background: {self.background};
-                color: {self.color};
-                border: 1px solid {self.border_color};
-                border-radius: 15px;
-                padding: 12px 20px;
-                font: 500 {self._base_font_size}px 'Microsoft YaHei';
-                text-align: left;
-                min-height: {int(self._base_font_size * 2.618)}px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(255, 255, 255, 0.35),
-                    stop:1 rgba(255, 215, 225, 0.3)
-                );
-            }}
-            QPushButton:checked {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(255, 255, 255, 0.45),
-                    stop:1 rgba(255, 235, 240, 0.4)
-                );
-                border-color: rgba(255, 255, 255, 0.6);
-                color: #222222;
-            }}
-        """)
-
-    @property
-    def background(self) -> str:
-        return "rgba(255, 255, 255, 0.15)" if not self.isChecked() else "rgba(255, 255, 255, 0.25)"
-
-    @property
-    def color(self) -> str:
-        # Darker text for better contrast
-        return "#222222" if self.isChecked() else "#333333"
-
-    @property
-    def border_color(self) -> str:
-        return "rgba(255, 255, 255, 0.2)" if not self.isChecked() else "rgba(255, 255, 255, 0.35)"
+        self._play_hover(QAbstractAnimation.Direction.Backward, 0.0)
+
+    def paintEvent(self, event) -> None:
+        # 阴影位图预先渲染, 悬停时仅在硬阴影与模糊阴影之间做透明度混合
+        width = self.width() - _NAV_SHADOW_MARGIN
+        height = self.height() - _NAV_SHADOW_MARGIN
+        if width > 0 and height > 0:
+            progress = self._shadow_progress
+            start, end = self._SHADOW_OFFSET
+            offset = round(start + (end - start) * progress)
+            painter = QPainter(self)
+            if progress < 1.0:
+                painter.setOpacity(1.0 - progress)
+                painter.drawPixmap(
+                    start, start, self._shadow_pixmap(width, height, 0))
+            if progress > 0.0:
+                painter.setOpacity(progress)
+                painter.drawPixmap(offset, offset, self._shadow_pixmap(
+                    width, height, self._SHADOW_BLUR))
+            painter.end()
+        super().paintEvent(event)
 
 
 class AnimatedStack(QStackedWidget):
@@ -246,13 +403,17 @@ class AnimatedStack(QStackedWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.animation_duration: int = 320
-        self._current_animation: Optional[QParallelAnimationGroup] = None
+        self._current_animation: Optional[QVariantAnimation] = None
+        # 进行中的切换 (旧页, 新页)
+        self._transition: Optional[Tuple[QWidget, QWidget]] = None
         self.easing_curve: QEasingCurve.Type = QEasingCurve.Type.OutCubic
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
 
     def slide_fade(self, new_index: int) -> None:
         if not 0 <= new_index < self.count():
             raise IndexError(f"Invalid index: {new_index}")
+        # 先收尾被打断的切换, 使 currentIndex 与页面位置同步
+        self._finish_current_animation()
         if self.currentIndex() == new_index or not self.isVisible():
             return
 
@@ -270,42 +431,94 @@ class AnimatedStack(QStackedWidget):
         new.show()
         new.raise_()
 
-        self._current_animation = QParallelAnimationGroup()
-
-        old_pos_anim = QPropertyAnimation(old, b"pos")
-        old_pos_anim.setDuration(self.animation_duration)
-        old_pos_anim.setStartValue(QPoint(0, 0))
-        old_pos_anim.setEndValue(QPoint(-self.width()//3, 0))
-
-        old_opacity_anim = QPropertyAnimation(old, b"windowOpacity")
-        old_opacity_anim.setStartValue(1.0)
-        old_opacity_anim.setEndValue(0.5)
-
-        new_pos_anim = QPropertyAnimation(new, b"pos")
-        new_pos_anim.setStartValue(QPoint(self.width(), 0))
-        new_pos_anim.setEndValue(QPoint(0, 0))
+        # 单个动画驱动新旧页面的位置与透明度, 每帧只做一次调度与缓动计算
+        width = self.width()
+        old_offset = -(width // 3)
 
-        new_opacity_anim = QPropertyAnimation(new, b"windowOpacity")
-        new_opacity_anim.setStartValue(0.0)
-        new_opacity_anim.setEndValue(1.0)
+        def step(t: float) -> None:
+            old.move(int(old_offset * t), 0)
+            old.setWindowOpacity(1.0 - 0.5 * t)
+            new.move(int(width * (1.0 - t)), 0)
+            new.setWindowOpacity(t)
 
-        for anim in [old_pos_anim, old_opacity_anim, new_pos_anim, new_opacity_anim]:
-            anim.setDuration(self.animation_duration)
-            anim.setEasingCurve(self.easing_curve)
-            self._current_animation.addAnimation(anim)
+        self._transition = (old, new)
+        self._current_animation = QVariantAnimation(self)
+        self._current_animation.setStartValue(0.0)
+        self._current_animation.setEndValue(1.0)
+        self._current_animation.setDuration(self.animation_duration)
+        self._current_animation.setEasingCurve(self.easing_curve)
+        self._current_animation.valueChanged.connect(step)
 
         self._current_animation.finished.connect(
             lambda: self._handle_animation_finish(old, new))
 
+    def _finish_current_animation(self) -> None:
+        """将进行中的切换直接跳到终点并执行收尾; stop() 不会发出 finished"""
+        animation = self._current_animation
+        if animation is None or self._transition is None:
+            return
+        animation.finished.disconnect()
+        animation.setCurrentTime(animation.duration())
+        animation.stop()
+        self._handle_animation_finish(*self._transition)
+
     def _handle_animation_finish(self, old: QWidget, new: QWidget) -> None:
+        self._transition = None
         self.setCurrentWidget(new)
         old.hide()
         old.setWindowOpacity(1.0)
         old.move(0, 0)
+        if self._current_animation:
+            self._current_animation.deleteLater()
         self._current_animation = None
         self.animation_finished.emit(self.indexOf(new))
 
 
+class _DecorationSignal(QObject):
+    """背景图片合成完成信号"""
+    finished = Signal(QImage)
+
+
+class _DecorationLoader(QRunnable):
+    """在线程池中解码、缩放并合成半透明背景图片。仅使用线程安全的 QImage"""
+
+    def __init__(self, image_ref: Any, width: int, height: int, signal: _DecorationSignal):
+        super().__init__()
+        self.image_ref = image_ref
+        self.width = width
+        self.height = height
+        self.signal = signal
+
+    def run(self):
+        try:
+            import importlib.resources
+
+            # 解码时直接缩放到目标尺寸, 不在内存中保留原始分辨率的图片
+            with importlib.resources.as_file(self.image_ref) as image_path:
+                reader = QImageReader(str(image_path))
+                reader.setAutoTransform(True)
+                reader.setScaledSize(QSize(self.width, self.height))
+                scaled = reader.read()
+
+            if scaled.isNull():
+                logger.warning(f"无法加载图片: {image_path}, {reader.errorString()}")
+                return
+
+            # 创建半透明效果
+            result = QImage(scaled.size(),
+                            QImage.Format.Format_ARGB32_Premultiplied)
+            result.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(result)
+            painter.setOpacity(0.72)
+            painter.drawImage(0, 0, scaled)
+            painter.end()
+
+            self.signal.finished.emit(result)
+        except Exception as e:
+            logger.error(f"加载背景图片失败: {e}")
+
+
 class MainWindow(QWidget):
     PAGE_NAMES: ClassVar[List[str]] = ["概览", "Bot", "信息", "插件"]
     ICON_NAMES: ClassVar[List[str]] = ["📊", "🤖", "📨", "🔌"]  # "⚙️"
@@ -319,8 +532,15 @@ class MainWindow(QWidget):
         self.pages: Dict[int, PageBase] = {}
         self.buttons: List[NavButton] = []
         self.current_index: int = 0
+        # 按尺寸预先栅格化的窗口底色与边缘阴影, 替代整窗 QGraphicsDropShadowEffect 的离屏合成
+        self._bg_image: Optional[QImage] = None
+        self._mask_key: Optional[Tuple[int, int, bool]] = None
+        # 约一帧的间隔, 拖拽缩放时每帧至多更新一次遮罩, 又不会让新区域长时间被旧遮罩裁掉
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._finalize_resize)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        self.setup_shadows()
         self.init_ui()
         self.setWindowTitle("TEEEA")
         self.setup_tray()
@@ -340,6 +560,8 @@ class MainWindow(QWidget):
         self.overlay_stacks: Dict[int, List['OverlayContainer']] = {}
         self.current_overlay = None
 
+        self._decoration_signal = _DecorationSignal(self)
+        self._decoration_signal.finished.connect(self._apply_decoration_image)
         self.load_decoration_image()
 
         QTimer.singleShot(0, talker.start)
@@ -521,59 +743,37 @@ class MainWindow(QWidget):
                 logger.warning("未找到背景图片文件夹")
                 return
 
-            # 获取所有图片文件
-            image_files = []
-            if hasattr(bg_folder, 'iterdir'): # For Path objects
-                for ext in ['.jpg', '.png', '.jpeg']:
-                    image_files.extend(bg_folder.glob(f"*{ext}"))
-                    image_files.extend(bg_folder.glob(f"*{ext.upper()}"))
-            else: # For Nuitka's resource reader
-                for item in bg_folder.iterdir():
-                    if item.is_file() and item.name.lower().endswith(('.jpg', '.png', '.jpeg')):
-                        image_files.append(item)
+            # 获取所有图片文件, 单次遍历同时兼容 Path 与 Nuitka 的资源读取器
+            image_files = [
+                item for item in bg_folder.iterdir()
+                if item.name.lower().endswith(('.jpg', '.png', '.jpeg')) and item.is_file()
+            ]
 
             if not image_files:
                 logger.warning("未找到可用的背景图片")
                 return
 
-            # 随机选择一张图片
-            image_path_obj = random.choice(image_files)
-            
-            pixmap = QPixmap()
-            with importlib.resources.as_file(image_path_obj) as image_path:
-                pixmap.load(str(image_path))
-
-            if pixmap.isNull():
-                logger.warning(f"无法加载图片: {image_path}")
-                return
-
-            # 缩放图片并创建半透明效果
-            scaled_pixmap = pixmap.scaled(
+            # 随机选择一张图片, 解码与缩放在线程池中完成, 避免阻塞界面
+            loader = _DecorationLoader(
+                random.choice(image_files),
                 self.sidebar.width(),
                 self.sidebar.height(),
-                aspectMode=Qt.AspectRatioMode.IgnoreAspectRatio,
-                mode=Qt.TransformationMode.SmoothTransformation
-            )
-
-            transparent_pixmap = QPixmap(scaled_pixmap.size())
-            transparent_pixmap.fill(Qt.GlobalColor.transparent)
-
-            painter = QPainter(transparent_pixmap)
-            painter.setOpacity(0.72)
-            painter.drawPixmap(0, 0, scaled_pixmap)
-            painter.end()
-
-            # 设置背景
-            self.bg_decoration.setPixmap(transparent_pixmap)
-            self.bg_decoration.setGeometry(
-                0, 0,
-                self.sidebar.width(),
-                self.sidebar.height()
+                self._decoration_signal
             )
+            QThreadPool.globalInstance().start(loader)
 
         except Exception as e:
             logger.error(f"加载背景图片失败: {e}")
 
+    def _apply_decoration_image(self, image: QImage) -> None:
+        """在界面线程中将后台合成好的图片设为背景"""
+        self.bg_decoration.setPixmap(QPixmap.fromImage(image))
+        self.bg_decoration.setGeometry(
+            0, 0,
+            self.sidebar.width(),
+            self.sidebar.height()
+        )
+
     def init_ui(self) -> None:
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -582,26 +782,6 @@ class MainWindow(QWidget):
         main_layout.addWidget(self.sidebar, stretch=3)
         main_layout.addWidget(self.create_page_container(), stretch=7)
 
-        self.window_shadow = QGraphicsDropShadowEffect(self)
-        self.window_shadow.setBlurRadius(30)
-        self.window_shadow.setXOffset(0)
-        self.window_shadow.setYOffset(0)
-        self.window_shadow.setColor(QColor(0, 0, 0, 80))
-        self.setGraphicsEffect(self.window_shadow)
-
-    def setup_shadows(self):
-        self.sidebar_shadow = QGraphicsDropShadowEffect()
-        self.sidebar_shadow.setBlurRadius(48)
-        self.sidebar_shadow.setXOffset(3)
-        self.sidebar_shadow.setYOffset(3)
-        self.sidebar_shadow.setColor(QColor(255, 182, 193, 60))
-
-        self.page_shadow = QGraphicsDropShadowEffect()
-        self.page_shadow.setBlurRadius(64)
-        self.page_shadow.setXOffset(3)
-        self.page_shadow.setYOffset(3)
-        self.page_shadow.setColor(QColor(12, 18, 28, 25))
-
     def create_sidebar(self) -> QWidget:
         sidebar = QWidget()
         sidebar.setObjectName("sidebar")
@@ -613,19 +793,7 @@ class MainWindow(QWidget):
         layout.setSpacing(0)
 
         brand = QLabel()
-        brand_pixmap = QPixmap(64, 64)
-        brand_pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(brand_pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QBrush(QColor(255, 255, 255, 220)))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(0, 0, 64, 64)
-        painter.setFont(QFont("Segoe UI Emoji", 18))
-        painter.setPen(QColor(50, 50, 50))
-        painter.drawText(brand_pixmap.rect(),
-                         Qt.AlignmentFlag.AlignCenter, "🍵")
-        painter.end()
-        brand.setPixmap(brand_pixmap)
+        brand.setPixmap(_get_brand_pixmap())
         brand.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         title = QLabel("TEEEA")
@@ -643,12 +811,7 @@ class MainWindow(QWidget):
 
         line = QLabel()
         line.setFixedHeight(2)
-        line.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0.5, x2:1, y2:0.5,
-                stop:0 rgba(255,255,255,0), 
-                stop:0.5 rgba(255,255,255,0.9),
-                stop:1 rgba(255,255,255,0));
-        """)
+        line.setObjectName("sidebarLine")
         layout.addWidget(line)
         layout.addSpacerItem(QSpacerItem(
             0, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
@@ -667,14 +830,7 @@ class MainWindow(QWidget):
         layout.addWidget(button_container)
         version = QLabel(f"✨ Version {os.getenv('UIVERSION')}")
         version.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version.setStyleSheet("""
-            color: #222222;  
-            font: italic 12px 'Comic Sans MS';
-            background: rgba(255, 255, 255, 0.25);
-            border-radius: 12px;
-            padding: 6px 16px;
-            border: 1px solid rgba(255, 255, 255, 0.3);
-        """)
+        version.setObjectName("versionLabel")
         layout.addSpacerItem(QSpacerItem(
             0, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
         layout.addWidget(version)
@@ -682,8 +838,6 @@ class MainWindow(QWidget):
         layout.addSpacerItem(QSpacerItem(
             0, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
         layout.addWidget(self.create_window_controls())
-
-        sidebar.setGraphicsEffect(self.sidebar_shadow)
         return sidebar
 
     def create_window_controls(self) -> QWidget:
@@ -693,8 +847,8 @@ class MainWindow(QWidget):
         control_layout.setSpacing(8)
         control_layout.addStretch()
 
-        self.min_btn = self.create_control_button("−", "#FFB6C1")
-        self.close_btn = self.create_control_button("×", "#FF69B4")
+        self.min_btn = self.create_control_button("−", "min")
+        self.close_btn = self.create_control_button("×", "close")
 
         self.min_btn.clicked.connect(self._hide)
         self.close_btn.clicked.connect(self.quit_app)
@@ -703,30 +857,12 @@ class MainWindow(QWidget):
         control_layout.addWidget(self.close_btn)
         return control_widget
 
-    def create_control_button(self, text: str, color: str) -> QPushButton:
+    def create_control_button(self, text: str, kind: str) -> QPushButton:
         btn = QPushButton(text)
+        btn.setObjectName("windowControl")
+        btn.setProperty("kind", kind)
         btn.setFixedSize(32, 32)
         btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                color: white;
-                font: bold 16px 'Arial';
-                border-radius: 16px;
-                background: {color};
-                min-width: 32px;
-                max-width: 32px;
-                min-height: 32px;
-                max-height: 32px;
-            }}
-            QPushButton:hover {{
-                background: qradialgradient(
-                    cx:0.5, cy:0.5, radius:0.5,
-                    fx:0.5, fy:0.5,
-                    stop:0 {color},
-                    stop:1 rgba(255,255,255,0.4)
-                );
-            }}
-        """)
         return btn
 
     def paintEvent(self, event):
@@ -738,84 +874,114 @@ class MainWindow(QWidget):
             return
 
         try:
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            target_rect = self.rect().adjusted(5,  5, -5, -5)
-
-            path = QPainterPath()
-            path.addRoundedRect(QRectF(target_rect),  15.0, 15.0)
-            painter.fillPath(path,  QColor(255, 255, 255, 255))
+            ratio = self.devicePixelRatioF()
+            if (self._bg_image is None
+                    or self._bg_image.devicePixelRatio() != ratio
+                    or self._bg_image.deviceIndependentSize().toSize() != self.size()):
+                self._bg_image = self._build_background(ratio)
+            painter.drawImage(0, 0, self._bg_image)
         except:
             import traceback
             traceback.print_exc()
         finally:
             painter.end()
 
+    def _build_background(self, ratio: float) -> QImage:
+        """栅格化窗口底色与外圈阴影, 仅在尺寸变化时重新绘制"""
+        image = QImage(self.size() * ratio,
+                       QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect().adjusted(5, 5, -5, -5)), 15.0, 15.0)
+
+        outer = QPainterPath()
+        outer.addRoundedRect(QRectF(self.rect()), 20.0, 20.0)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillPath(outer.subtracted(path), QColor(0, 0, 0, 40))
+        painter.fillPath(path,  QColor(255, 255, 255, 255))
+        painter.end()
+        return image
+
     def create_nav_button(self, text: str, index: int) -> NavButton:
         icon = create_icon_from_unicode(self.ICON_NAMES[index])
         btn = NavButton(icon, self.PAGE_NAMES[index])
         btn.setProperty("page_index", index)
-        btn.clicked.connect(lambda checked, idx=index: self.switch_page(idx))
+        btn.clicked.connect(self._on_nav_clicked)
         return btn
 
+    def _on_nav_clicked(self, checked: bool = False) -> None:
+        """所有导航按钮共用的槽, 页面索引取自按钮属性"""
+        sender = self.sender()
+        if sender is not None:
+            self.switch_page(sender.property("page_index"))
+
     def create_page_container(self) -> AnimatedStack:
         self.stack = AnimatedStack(parent=self)
+        # 概览为首屏, Bot 与信息页需从启动起订阅实时事件, 必须立即构建
         self.pages = {
             0: OverviewPage(parent=self),
             1: BotInfoPage(parent=self),
             2: MessagePage(parent=self),
-            3: PluginPage(parent=self),
-            # 4: SettingsPage(parent=self)
         }
-        for idx, page in self.pages.items():
-            if not isinstance(page, PageBase):
-                raise RuntimeError("主页面必须是PageBase类型")
-            page.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        # 其余页面首次切换时再构建, 在此之前以空白占位
+        self._page_factories: Dict[int, Callable[..., PageBase]] = {
+            3: PluginPage,
+            # 4: SettingsPage
+        }
+        for idx in range(len(self.PAGE_NAMES)):
+            page = self.pages.get(idx)
+            if page is None:
+                self.stack.addWidget(QWidget())
+                continue
+            self._prepare_page(page)
             self.stack.addWidget(page)
         return self.stack
 
+    @staticmethod
+    def _prepare_page(page: QWidget) -> None:
+        if not isinstance(page, PageBase):
+            raise RuntimeError("主页面必须是PageBase类型")
+        page.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+
+    def _ensure_page(self, index: int) -> None:
+        """按需构建页面并替换占位控件"""
+        if index in self.pages:
+            return
+        page = self._page_factories.pop(index)(parent=self)
+        self._prepare_page(page)
+
+        placeholder = self.stack.widget(index)
+        if placeholder is not None:
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+        self.stack.insertWidget(index, page)
+        self.pages[index] = page
+
     def switch_page(self, index: int) -> None:
         if not 0 <= index < len(self.PAGE_NAMES):
             raise IndexError(f"无效页面索引: {index}")
         if index == self.current_index:
             return
 
-        for i, btn in enumerate(self.buttons):
-            btn.setChecked(i == index)
+        # 只有旧页与新页的按钮状态会变化, 其余按钮无需触碰以免重复 polish
+        self.buttons[self.current_index].setChecked(False)
+        self.buttons[index].setChecked(True)
 
+        self._ensure_page(index)
         self.stack.slide_fade(index)
         self.current_index = index
 
     def setup_styles(self) -> None:
-        self.setStyleSheet("""
-        #sidebar {
-             background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-            stop:0 rgba(255, 245, 245, 0.98),
-            stop:1 rgba(255, 255, 255, 0.95));
-            margin: 0px;
-            border-top-left-radius: 15px;
-            border-bottom-left-radius: 15px;
-        }
-
-        #title {
-            font: bold 28px 'Comic Sans MS';
-            color: #222222;  /* Darker text for better contrast */
-            padding: 24px 0;
-            margin: 16px 0;
-            letter-spacing: 2px;
-        }
-
-        QWidget#mainStack {
-            background: white;
-            margin: 0px;
-            border: 2px solid rgba(0, 0, 0, 0.1);
-            border-top-right-radius: 15px;
-            border-bottom-right-radius: 15px;
-        }
-       MainWindow {
-            background: transparent;
-            border: 1px solid rgba(127, 127, 127, 0.3);
-        }
-        """)
+        # 在应用级设置一次, 避免各控件分别解析样式表并触发多次 polish
+        app = QApplication.instance()
+        if isinstance(app, QApplication):
+            app.setStyleSheet(_MAIN_WINDOW_QSS)
+        else:
+            self.setStyleSheet(_MAIN_WINDOW_QSS)
 
     def _hide(self):
         if self.tray_icon.isVisible():
@@ -845,20 +1011,17 @@ class MainWindow(QWidget):
             event.accept()
 
     def update_mask(self):
-        if self.isMaximized() or self.isFullScreen():
+        maximized = self.isMaximized() or self.isFullScreen()
+        # 尺寸与窗口状态均未变化时遮罩相同, 跳过重复的 setMask
+        mask_key = (self.width(), self.height(), maximized)
+        if mask_key == self._mask_key:
+            return
+        self._mask_key = mask_key
+
+        if maximized:
             self.clearMask()
         else:
-            bitmap = QBitmap(self.size())
-            bitmap.fill(Qt.GlobalColor.color0)
-
-            painter = QPainter(bitmap)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(Qt.GlobalColor.color1)
-            painter.drawRoundedRect(self.rect().adjusted(
-                1, 1, -1, -1), 15, 15)
-            painter.end()
-            self.setMask(bitmap)
+            self.setMask(_build_mask(self.width(), self.height()))
 
     def resizeEvent(self, event: QResizeEvent):
         super().resizeEvent(event)
@@ -869,6 +1032,12 @@ class MainWindow(QWidget):
             parent = self.current_overlay.parent()
             if isinstance(parent, QWidget):
                 self.current_overlay.resize(parent.size())
+        # 计时器运行中不重启, 拖动缩放时仍保持每帧至多一次收尾, 而非停下后才更新
+        if not self._resize_timer.isActive():
+            self._resize_timer.start()
+
+    def _finalize_resize(self):
+        """合并后的 resize 收尾工作"""
         self.update_mask()
 
     def showEvent(self, event):
@@ -877,6 +1046,7 @@ class MainWindow(QWidget):
 
     def changeEvent(self, event):
         if event.type() == QEvent.Type.WindowStateChange:
+            self._bg_image = None
             self.update_mask()
         super().changeEvent(event)
 
@@ -27,9 +27,8 @@ class PageBase(QWidget):
         self._is_loaded = False  # 资源加载状态标记
         self._debounce_interval = 200  # 防抖时间间隔
 
-        # 初始化定时器
-        self._enter_timer = self._create_timer(self._handle_enter)
-        self._leave_timer = self._create_timer(self._handle_leave)
+        # 进入与离开互斥, 共用一个防抖定时器, 到期时按可见性分派
+        self._transition_timer = self._create_timer(self._handle_transition)
 
     def show_subpage(self, widget: QWidget, title: str):
         parent = self.parent()
@@ -64,22 +63,25 @@ class PageBase(QWidget):
             self.on_first_enter()
             self._is_loaded = True
 
-        # 取消待处理的离开事件
-        self._leave_timer.stop()
-        # 延迟触发进入事件
-        self._enter_timer.start(self._debounce_interval)
+        # 重新计时, 取代待处理的离开事件
+        self._transition_timer.start(self._debounce_interval)
 
         super().showEvent(event)
 
     def hideEvent(self, event):
         """隐藏事件处理"""
-        # 取消待处理的进入事件
-        self._enter_timer.stop()
-        # 延迟触发离开事件
-        self._leave_timer.start(self._debounce_interval)
+        # 重新计时, 取代待处理的进入事件
+        self._transition_timer.start(self._debounce_interval)
 
         super().hideEvent(event)
 
+    def _handle_transition(self):
+        """防抖结束后根据最终可见性触发进入或离开"""
+        if self.isVisible():
+            self._handle_enter()
+        else:
+            self._handle_leave()
+
     def _handle_enter(self):
         """实际处理页面进入"""
         if self.isVisible():
@@ -1,4 +1,5 @@
 import time
+from functools import lru_cache
 from typing import Dict, Optional
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
                                QSizePolicy, QMenu,
@@ -14,6 +15,107 @@ from .utils.subpages.datan import PluginStatsViewer
 from .utils.client import talker, ResponsePayload
 
 
+_METRIC_COLORS = {
+    "total": "#2196F3",
+    "rate": "#4CAF50",
+    "uptime": "#FF9800",
+}
+
+# BotCard 中与主题色无关的样式, 子控件以 objectName/属性区分
+_BOT_CARD_QSS = """
+    BotCard {
+        background: white;
+        border-radius: 12px;
+        border: none;
+        padding: 0;
+        margin: 0;
+    }
+    QLabel {
+        margin: 0;
+        padding: 0;
+    }
+    QLabel#statusIndicator {
+        border-radius: 6px;
+        border: 2px solid white;
+    }
+    QLabel#botIdLabel {
+        font: bold 16px '微软雅黑';
+    }
+    QLabel#botDetails {
+        font: 12px 'Segoe UI';
+    }
+    QFrame#cardSeparator {
+        margin: 4px 0;
+    }
+    QWidget#cardContent, QWidget#cardContent QWidget {
+        background: transparent;
+    }
+    QLabel#metricBar {
+        border-radius: 2px;
+    }
+    QLabel#metricTitle {
+        font: 12px;
+    }
+    QLabel#metricValue {
+        padding-left: 8px;
+        font: bold 16px 'Segoe UI';
+        margin-right: 8px;
+    }
+    QWidget#cardFooter, QWidget#cardFooter QLabel {
+        border-radius: 6px;
+        padding: 6px 12px;
+        color: white;
+    }
+    QWidget#cardFooter QLabel#statusText {
+        font: 12px;
+    }
+    QWidget#cardFooter QLabel#lastUpdate {
+        color: #666666;
+        font: 11px;
+    }
+""" + "".join(f"""
+    QLabel#metricBar[metric="{key}"] {{
+        background: {color};
+    }}
+    QLabel#metricTitle[metric="{key}"], QLabel#metricValue[metric="{key}"] {{
+        color: {color};
+    }}
+""" for key, color in _METRIC_COLORS.items())
+
+
+@lru_cache(maxsize=64)
+def _card_style(theme: str, online: bool) -> str:
+    """按主题色与在线状态生成完整卡片样式, 同一状态的卡片复用同一字符串"""
+    color = QColor(theme)
+    return _BOT_CARD_QSS + f"""
+    QLabel#statusIndicator {{
+        background: {'#4CAF50' if online else '#F44336'};
+    }}
+    QLabel#botIdLabel {{
+        color: {color.darker().name()};
+    }}
+    QLabel#botDetails {{
+        color: {'#777777' if online else '#AAAAAA'};
+    }}
+    QFrame#cardSeparator {{
+        color: {color.lighter(180).name()};
+    }}
+    QWidget#topDecorator {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {color.name()},
+            stop:1 {color.lighter(120).name()});
+        border-top-left-radius: 12px;
+        border-top-right-radius: 12px;
+    }}
+    QWidget#cardFooter, QWidget#cardFooter QLabel {{
+        background: {color.lighter(115).name()};
+    }}
+    QWidget#cardFooter QLabel#statusText {{
+        color: {color.darker(150).name()};
+    }}
+"""
+
+
 class BotCard(QFrame):
     """Bot卡片"""
     status_changed = Signal(bool)
@@ -30,6 +132,9 @@ class BotCard(QFrame):
         if not self.theme_color.isValid():
             self.theme_color = QColor("#6A11CB")
         self.last_update_time = time.time()
+        self.last_rate = 0.0
+        self.stats_stale = True  # 需要完整统计一次, 如新建或重新上线时
+        self._border_color = self._compute_border_color()
         self._init_style()
         self._init_ui()
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -53,19 +158,11 @@ class BotCard(QFrame):
         shadow.setOffset(0, 4)
         self.setGraphicsEffect(shadow)
 
-        self.setStyleSheet(f"""
-            BotCard {{
-                background: white;
-                border-radius: 12px;
-                border: none;
-                padding: 0;
-                margin: 0;
-            }}
-            QLabel {{
-                margin: 0;
-                padding: 0;
-            }}
-        """)
+        self._apply_style()
+
+    def _apply_style(self):
+        """一次性应用整张卡片的样式, 代替逐个子控件设置"""
+        self.setStyleSheet(_card_style(self.theme_color.name(), self._is_online))
 
     def _init_ui(self):
         main_layout = QVBoxLayout()
@@ -84,12 +181,8 @@ class BotCard(QFrame):
 
         # 状态指示器
         self.status_indicator = QLabel()
+        self.status_indicator.setObjectName("statusIndicator")
         self.status_indicator.setFixedSize(12, 12)
-        self.status_indicator.setStyleSheet(f"""
-            background: {'#4CAF50' if self._is_online else '#F44336'};
-            border-radius: 6px;
-            border: 2px solid white;
-        """)
 
         # ID和适配器信息区
         info_widget = QWidget()
@@ -99,17 +192,11 @@ class BotCard(QFrame):
 
         # ID显示
         self.id_label = QLabel(self.bot_id)
-        self.id_label.setStyleSheet(f"""
-            font: bold 16px '微软雅黑';
-            color: {self.theme_color.darker().name()};
-        """)
+        self.id_label.setObjectName("botIdLabel")
 
         # 细节信息
         self.details_label = QLabel(f"{self.platform} via {self.adapter_name}")
-        self.details_label.setStyleSheet(f"""
-            font: 12px 'Segoe UI';
-            color: #777777;
-        """)
+        self.details_label.setObjectName("botDetails")
 
         info_layout.addWidget(self.id_label)
         info_layout.addWidget(self.details_label)
@@ -125,14 +212,11 @@ class BotCard(QFrame):
         # 分隔线
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet(f"""
-            color: {self.theme_color.lighter(180).name()};
-            margin: 4px 0;
-        """)
+        separator.setObjectName("cardSeparator")
         main_layout.addWidget(separator)
 
         content = QWidget()
-        content.setStyleSheet("background: transparent;")
+        content.setObjectName("cardContent")
         content_layout = QVBoxLayout()
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(12)
@@ -143,20 +227,20 @@ class BotCard(QFrame):
         self.time_label = QLabel("--")
 
         metrics = [
-            ("消息总量", self.total_msg, "#2196F3"),
-            ("近30分钟处理速率", self.rate_label, "#4CAF50"),
-            ("在线时长", self.time_label, "#FF9800")
+            ("消息总量", self.total_msg, "total"),
+            ("近30分钟处理速率", self.rate_label, "rate"),
+            ("在线时长", self.time_label, "uptime")
         ]
 
-        for title, value, color in metrics:
+        for title, value, metric in metrics:
             metric_widget = QWidget()
             metric_layout = QHBoxLayout()
             metric_layout.setContentsMargins(8, 6, 8, 6)
             metric_layout.setSpacing(10)
             decorator = QLabel()
             decorator.setFixedWidth(4)
-            decorator.setStyleSheet(
-                f"background: {color}; border-radius: 2px;")
+            decorator.setObjectName("metricBar")
+            decorator.setProperty("metric", metric)
             metric_widget.setSizePolicy(
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
             decorator.setSizePolicy(
@@ -166,18 +250,15 @@ class BotCard(QFrame):
             text_layout.setContentsMargins(0, 0, 0, 0)
             text_layout.setSpacing(4)
             title_label = QLabel(title)
-            title_label.setStyleSheet(f"color: {color}; font: 12px;")
+            title_label.setObjectName("metricTitle")
+            title_label.setProperty("metric", metric)
             value.setWordWrap(True)
             value.setAlignment(Qt.AlignmentFlag.AlignLeft |
                                Qt.AlignmentFlag.AlignVCenter)
             value.setSizePolicy(QSizePolicy.Policy.Expanding,
                                 QSizePolicy.Policy.Minimum)
-            value.setStyleSheet(f"""
-                color: {color};
-                padding-left: 8px;
-                font: bold 16px 'Segoe UI';
-                margin-right: 8px;
-            """)
+            value.setObjectName("metricValue")
+            value.setProperty("metric", metric)
             text_layout.addWidget(title_label)
             text_layout.addWidget(value)
             text_widget.setLayout(text_layout)
@@ -192,28 +273,20 @@ class BotCard(QFrame):
 
         # 底部状态栏
         self.footer = QWidget()
-        self.footer.setStyleSheet(f"""
-            background: {self.theme_color.lighter(115).name()};
-            border-radius: 6px;
-            padding: 6px 12px;
-            color: white; 
-        """)
+        self.footer.setObjectName("cardFooter")
         footer_layout = QHBoxLayout()
         footer_layout.setContentsMargins(0, 0, 0, 0)
         footer_layout.setSpacing(8)
 
         self.status_text = QLabel("在线" if self._is_online else "离线")
-        self.status_text.setStyleSheet(f"""
-            color: {self.theme_color.darker(150).name()};
-            font: 12px;
-        """)
+        self.status_text.setObjectName("statusText")
 
         footer_layout.addWidget(self.status_text)
         footer_layout.addStretch()
 
         self.last_update = QLabel()
+        self.last_update.setObjectName("lastUpdate")
         self._update_time_text()
-        self.last_update.setStyleSheet("color: #666666; font: 11px;")
         footer_layout.addWidget(self.last_update)
 
         self.footer.setLayout(footer_layout)
@@ -221,15 +294,9 @@ class BotCard(QFrame):
 
     def _add_top_decorator(self):
         self.decorator = QWidget(self)
+        self.decorator.setObjectName("topDecorator")
         self.decorator.setFixedHeight(4)
-        self.decorator.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 {self.theme_color.name()}, 
-                stop:1 {self.theme_color.lighter(120).name()});
-            border-top-left-radius: 12px;
-            border-top-right-radius: 12px;
-        """)
-        self.decorator.setGeometry(0, 0, self.width(), 4)
+        self._resize_decorator()
         self.decorator.setAttribute(
             Qt.WidgetAttribute.WA_TranslucentBackground, True)
 
@@ -244,8 +311,17 @@ class BotCard(QFrame):
         minutes = ((seconds % 3600) + 30) // 60
         return f"{days}d {hours}h {minutes}m" if days > 0 else f"{hours}h {minutes}m"
 
+    def update_uptime(self, uptime: int):
+        """仅刷新在线时长, 用于消息计数未变化的 bot"""
+        self.last_update_time = time.time()
+        self.time_label.setText(
+            self.format_uptime(uptime) if uptime > 0 else "--")
+        self._update_time_text()
+
     def update_data(self, total: int, rate: float, uptime: Optional[int] = None):
         self.last_update_time = time.time()
+        self.last_rate = rate
+        self.stats_stale = False
 
         try:
             total_text = f"{int(total):,}"
@@ -328,6 +404,7 @@ class BotCard(QFrame):
 
         self.status_text.setText("在线" if self._is_online else "离线")
         if self._is_online:
+            self.stats_stale = True
             BotToolKit.timer.set_online(self.bot_id)
         else:
             BotToolKit.timer.set_offline(self.bot_id)
@@ -336,8 +413,12 @@ class BotCard(QFrame):
         self._update_colors()
 
     def resizeEvent(self, event):
-        self._add_top_decorator()
         super().resizeEvent(event)
+        self._resize_decorator()
+
+    def _resize_decorator(self):
+        """装饰条只在 _init_ui 中创建一次, 尺寸变化时仅跟随宽度"""
+        self.decorator.setGeometry(0, 0, self.width(), 4)
 
     def paintEvent(self, event):
         super().paintEvent(event)
@@ -349,38 +430,16 @@ class BotCard(QFrame):
         border_path = QPainterPath()
         border_path.addRoundedRect(
             QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
-        pen_color = self.theme_color.lighter(
-            150) if self._is_online else self.offline_color.darker(110)
-        painter.setPen(QPen(pen_color, 1))
+        painter.setPen(QPen(self._border_color, 1))
         painter.drawPath(border_path)
 
+    def _compute_border_color(self) -> QColor:
+        """边框颜色只随主题色与在线状态变化, 在状态切换时计算, 绘制时直接使用"""
+        return self.theme_color.lighter(150) if self._is_online else self.offline_color.darker(110)
+
     def _update_colors(self):
-        self.status_indicator.setStyleSheet(f"""
-            background: {'#4CAF50' if self._is_online else '#F44336'};
-            border-radius: 6px; border: 2px solid white;
-        """)
-        self.decorator.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 {self.theme_color.name()}, 
-                stop:1 {self.theme_color.lighter(120).name()});
-            border-top-left-radius: 12px; border-top-right-radius: 12px;
-        """)
-        self.id_label.setStyleSheet(f"""
-            font: bold 16px '微软雅黑';
-            color: {self.theme_color.darker().name()};
-        """)
-        self.details_label.setStyleSheet(f"""
-            font: 12px 'Segoe UI';
-            color: {'#777777' if self._is_online else '#AAAAAA'};
-        """)
-        self.footer.setStyleSheet(f"""
-            background: {self.theme_color.lighter(115).name()};
-            border-radius: 6px; padding: 6px 12px; color: white; 
-        """)
-        self.status_text.setStyleSheet(f"""
-            color: {self.theme_color.darker(150).name()};
-            font: 12px;
-        """)
+        self._border_color = self._compute_border_color()
+        self._apply_style()
         self.update()
 
 
@@ -465,10 +524,15 @@ class BotInfoPage(PageBase):
     def _refresh_all_data(self):
         on_line_count = 0
         off_line_count = 0
+        # 仅对有新消息或速率尚未归零的 bot 重新统计, 其余只需刷新在线时长
+        dirty = BotToolKit.counter.pop_dirty()
         for bot_id, card in self.card_manager.cards.items():
             if card._is_online:
                 on_line_count += 1
                 on_line_time = BotToolKit.timer.get_elapsed_time(bot_id)
+                if bot_id not in dirty and not card.last_rate and not card.stats_stale:
+                    card.update_uptime(int(on_line_time))
+                    continue
                 on_line_minute = round(on_line_time / 60) or 1
                 period_minute = min(on_line_minute, 30)
                 rate = BotToolKit.counter.get_period_count(
@@ -1,5 +1,6 @@
 import time
-from typing import Dict, List, Literal, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Literal, Optional, Tuple
 
 import orjson
 from PySide6.QtCore import Qt, QTimer, QPoint, Signal, QMutex
@@ -86,6 +87,8 @@ class MessagePage(PageBase):
 
     MAX_AUTO_SCROLL_MESSAGES = 50  # 自动滚动模式下的最大消息数
     LOAD_COUNT = 20    # 每次加载消息数
+    FLUSH_INTERVAL = 16  # 待显示消息的合并间隔(ms), 约一帧
+    FLUSH_BATCH = 64   # 每次合并最多插入的消息数
     ACCENT_COLOR = "#38A5FD"
     msg_call_signal = Signal(str, dict)
 
@@ -121,6 +124,13 @@ class MessagePage(PageBase):
 
         self.search_bar = None  # 搜索状态条带
 
+        # 待显示的消息, 按帧合并插入以摊薄列表布局与滚动开销
+        self._pending: Deque[Tuple[MetadataType, str, str]] = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         self._setup_ui()
         self._setup_context_menu()
         self._connect_signals()
@@ -239,6 +249,7 @@ class MessagePage(PageBase):
         清空消息列表。
         必须手动遍历、获取控件、然后销毁。
         """
+        self._pending.clear()
         while self.list_widget.count() > 0:
             item = self.list_widget.item(0)
             widget = self.list_widget.itemWidget(item)
@@ -582,36 +593,60 @@ class MessagePage(PageBase):
             else:
                 metadata["time"] = (formatted_time, time_[1])  # type: ignore
 
-        QTimer.singleShot(0, lambda: self._safe_add_row(
-            metadata, content, accent_color or self.ACCENT_COLOR))
-
-    def _safe_add_row(self, metadata: MetadataType, content: str,
-                      accent_color: str) -> None:
-        """安全添加消息行，并正确处理旧消息的销毁"""
+        self._pending.append(
+            (metadata, content, accent_color or self.ACCENT_COLOR))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
+    def _flush_pending(self) -> None:
+        """批量插入待显示的消息, 整批只布局与滚动一次"""
+        pending = self._pending
         if self._auto_scroll:
+            # 自动滚动模式下超出上限的旧消息插入后会立即被移除, 直接跳过
+            while len(pending) > self.MAX_AUTO_SCROLL_MESSAGES:
+                pending.popleft()
+        if not pending:
+            return
+
+        count = min(len(pending), self.FLUSH_BATCH)
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            if self._auto_scroll:
+                # 整批插入前一次性腾出位置, 而非每插入一行移除一行
+                self._evict_oldest(
+                    self.list_widget.count() + count - self.MAX_AUTO_SCROLL_MESSAGES)
+            for _ in range(count):
+                self._safe_add_row(*pending.popleft())
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
-            while self.list_widget.count() >= self.MAX_AUTO_SCROLL_MESSAGES:
+        if self._auto_scroll:
+            self.list_widget.scrollToBottom()
+        if pending:
+            self._flush_timer.start()
 
-                item_to_remove = self.list_widget.item(0)
-                widget_to_remove = self.list_widget.itemWidget(item_to_remove)
+    def _evict_oldest(self, count: int) -> None:
+        """移除最早的 count 条消息，并正确处理其控件的销毁"""
+        for _ in range(min(count, self.list_widget.count())):
+            item_to_remove = self.list_widget.item(0)
+            widget_to_remove = self.list_widget.itemWidget(item_to_remove)
 
-                if widget_to_remove:
-                    if isinstance(widget_to_remove, MessageBubble):
-                        widget_to_remove.cleanup()
-                    widget_to_remove.deleteLater()
+            if widget_to_remove:
+                if isinstance(widget_to_remove, MessageBubble):
+                    widget_to_remove.cleanup()
+                widget_to_remove.deleteLater()
 
-                self.list_widget.takeItem(0)
+            self.list_widget.takeItem(0)
 
+    def _safe_add_row(self, metadata: MetadataType, content: str,
+                      accent_color: str) -> None:
+        """添加消息行, 旧消息的移除由 _flush_pending 整批处理"""
         item = QListWidgetItem()
         bubble = MessageBubble(metadata, content, accent_color,
                                self.list_widget, item)
         self.list_widget.addItem(item)
         self.list_widget.setItemWidget(item, bubble)
 
-        if self._auto_scroll:
-            self.list_widget.scrollToBottom()
-
     def _handle_auto_scroll(self, checked: bool) -> None:
         """处理自动滚动开关"""
         self._auto_scroll = checked
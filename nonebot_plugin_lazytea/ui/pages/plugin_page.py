@@ -15,7 +15,6 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 from .utils.env import IS_RUN_ALONE
 from .base_page import PageBase
 from .utils.version_check import VersionUtils
-from .utils.subpages.config_page import ConfigEditor
 from .utils.Qcomponents.MessageBox import MessageBoxBuilder, MessageBoxConfig, ButtonConfig
 from .utils.Qcomponents.networkmanager import ReleaseNetworkManager
 from .utils.ui_types.plugins import PluginInfo, PluginHTML
@@ -110,6 +109,8 @@ class PluginCard(QFrame):
             f"http://127.0.0.1:{port}/{plugin_name}")
 
     def _show_plugin_subpage(self, response: ResponsePayload):
+        from .utils.subpages.config_page import ConfigEditor
+
         schema: Dict[str, Any] = response.data.get("schema")  # type: ignore
         data: Dict[str, Any] = orjson.loads(
             response.data.get("data", ""))  # type: ignore
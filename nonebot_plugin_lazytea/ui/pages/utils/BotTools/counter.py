@@ -1,11 +1,11 @@
 import time
 import threading
 from collections import deque
-from typing import Dict, Union, Optional
+from typing import Dict, Set, Union, Optional
 
 class MsgCounter:
     """时间窗口计数器"""
-    __slots__ = ('_counters', '_max_period', '_merge_threshold', '_merge_ratio', '_lock')
+    __slots__ = ('_counters', '_max_period', '_merge_threshold', '_merge_ratio', '_lock', '_dirty')
     
     def __init__(self, 
                  max_period: int = 3600,
@@ -16,6 +16,7 @@ class MsgCounter:
         self._merge_ratio = merge_ratio
         self._counters: Dict[str, Dict[str, _Counter]] = {} # type: ignore
         self._lock = threading.RLock()
+        self._dirty: Set[str] = set()  # 自上次 pop_dirty 以来有新事件的 key
 
     class _Counter:
         """使用循环缓冲区和层级合并策略的计数器"""
@@ -117,12 +118,20 @@ class MsgCounter:
         with self._lock:
             counter = self._get_counter(key, event_type)
             counter.add_event(event_time or time.time())
+            self._dirty.add(key)
 
     def batch_add_events(self, key: str, event_type: str, count: int, 
                         event_time: Optional[float] = None):
         with self._lock:
             counter = self._get_counter(key, event_type)
             counter.add_event(event_time or time.time(), count)
+            self._dirty.add(key)
+
+    def pop_dirty(self) -> Set[str]:
+        """取出并清空自上次调用以来有新事件的 key"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            return dirty
 
     def _get_counter(self, key: str, event_type: str) -> "_Counter":
         if key not in self._counters:
@@ -1,15 +1,17 @@
 import time
 import os
+import heapq
+import itertools
 import uuid
 from urllib.parse import quote
-from collections import defaultdict
-from typing import List, Optional, Callable, Dict, Any, TypedDict
+from typing import List, Optional, Callable, Dict, Any, Tuple, TypedDict, Union
 from threading import Event, Lock
+from queue import SimpleQueue
 
 from websockets.sync.client import connect
 from websockets.exceptions import ConnectionClosed
 from pydantic import ValidationError
-from PySide6.QtCore import QThreadPool, QRunnable, Signal, QObject, Slot, SignalInstance, QTimer, QMutex, QMutexLocker
+from PySide6.QtCore import QThreadPool, QRunnable, Signal, QObject, Slot, SignalInstance, QTimer, QMutex, QMutexLocker, QMetaObject, Qt
 
 from .tealog import logger
 from .client_login.config_manager import ConnectionConfigManager, ConnectionDetails
@@ -17,13 +19,28 @@ from .client_login.login_ui import LoginDialog
 from ...protocol import ProtocolMessage, MessageHeader, RequestPayload, ResponsePayload
 
 
+# 进程内唯一即可, 前缀用于区分不同进程实例
+_msg_prefix = uuid.uuid4().hex[:8]
+_msg_counter = itertools.count()
+
+
+def _next_msg_id() -> str:
+    return f"{_msg_prefix}-{next(_msg_counter)}"
+
+
+_HEARTBEAT_TEMPLATE = ProtocolMessage.build_template(
+    "heartbeat", {"status": "alive"})
+
+
 class WorkerSignals(QObject):
-    message_received = Signal(MessageHeader, dict)
+    messages_received = Signal(list)
     connection_state = Signal(bool)
     error = Signal(str)
 
 
 class WebSocketWorker(QRunnable):
+    MAX_BATCH = 256
+
     def __init__(self, client: 'WebSocketClient'):
         super().__init__()
         self.client = client
@@ -31,16 +48,25 @@ class WebSocketWorker(QRunnable):
         self.stop_event = Event()
 
     def run(self):
-        if not self.client.uri:
+        uri = self.client.uri
+        if not uri:
             logger.error(
                 "WebSocketWorker started without a valid URI. Stopping.")
             self.signals.error.emit("Client URI not configured.")
             self.signals.connection_state.emit(False)
             return
 
+        decoder = DecodeWorker(self.signals)
+        self.client.thread_pool.start(decoder)
+        try:
+            self._run_connection_loop(uri, decoder)
+        finally:
+            decoder.queue.put(None)
+
+    def _run_connection_loop(self, uri: str, decoder: 'DecodeWorker'):
         while not self.stop_event.is_set():
             try:
-                with connect(self.client.uri) as websocket:
+                with connect(uri) as websocket:
                     with self.client.lock:
                         self.client.ws = websocket
 
@@ -52,14 +78,20 @@ class WebSocketWorker(QRunnable):
                     while not self.stop_event.is_set():
                         try:
                             message = websocket.recv(timeout=1)
-                            if message:
-                                if isinstance(message, bytes):
-                                    message = message.decode("utf-8")
-                                if isinstance(message, bytearray):
-                                    message = message.decode("utf-8")
-                                elif isinstance(message, memoryview):
-                                    message = message.tobytes().decode("utf-8")
-                                self._handle_message(message)
+                            frames: List[Union[str, bytes]] = []
+                            try:
+                                # 唤醒后一次性取走已到达的所有帧, 整批交给解码线程
+                                while True:
+                                    if message:
+                                        frames.append(message)
+                                    if len(frames) >= self.MAX_BATCH:
+                                        break
+                                    message = websocket.recv(timeout=0)
+                            except TimeoutError:
+                                pass
+                            finally:
+                                if frames:
+                                    decoder.queue.put(frames)
                         except TimeoutError:
                             continue
                         except (ConnectionClosed, ConnectionRefusedError):
@@ -86,40 +118,45 @@ class WebSocketWorker(QRunnable):
                 self.signals.connection_state.emit(False)
                 logger.info("WebSocket connection closed.")
 
-    def _handle_message(self, raw_data: str):
-        if ProtocolMessage.SEPARATOR in raw_data:
-            msg, _ = raw_data.split(ProtocolMessage.SEPARATOR, 1)
-            try:
-                header, payload = ProtocolMessage.decode(msg)
-                if header:
-                    self.signals.message_received.emit(header, payload)
-            except (ValidationError, Exception) as e:
-                self.signals.error.emit(f"Message decoding error: {e}")
 
+class DecodeWorker(QRunnable):
+    """从队列中取出原始帧进行解码, 使接收循环不被解码阻塞。单线程解码以保持消息顺序"""
 
-class HeartbeatWorker(QRunnable):
-    def __init__(self, client: 'WebSocketClient'):
+    def __init__(self, signals: WorkerSignals):
         super().__init__()
-        self.client = client
-        self.stop_event = Event()
+        self.signals = signals
+        self.queue: "SimpleQueue[Optional[List[Union[str, bytes]]]]" = SimpleQueue()
 
     def run(self):
-        while not self.stop_event.is_set():
-            if self.client.is_connected():
-                try:
-                    header = MessageHeader(
-                        msg_id=str(uuid.uuid4()),
-                        msg_type="heartbeat",
-                        timestamp=time.time(),
-                        correlation_id=None
-                    )
-                    message = ProtocolMessage.encode(
-                        header, {"status": "alive"})
-                    self.client.send_raw_message(message)
-                except Exception as e:
-                    logger.error(f"Heartbeat error: {e}")
-
-            self.stop_event.wait(5)
+        while True:
+            frames = self.queue.get()
+            if frames is None:
+                break
+            batch: List[Tuple[MessageHeader, Any]] = []
+            for message in frames:
+                # websockets 只会返回 str (文本帧) 或 bytes (二进制帧)，二者均可直接解码
+                self._handle_message(message, batch)
+            if batch:
+                self.signals.messages_received.emit(batch)
+
+    def _handle_message(self, raw_data: Union[str, bytes], batch: List[Tuple[MessageHeader, Any]]):
+        end = raw_data.find(ProtocolMessage.SEPARATOR_B if isinstance(
+            raw_data, bytes) else ProtocolMessage.SEPARATOR)  # type: ignore
+        if end != -1:
+            try:
+                header, payload = ProtocolMessage.decode(raw_data[:end])
+                if header is None:
+                    return
+                if header.msg_type == "batch":
+                    # 服务端合并发送的多条广播, 展开为独立消息, 数据已由服务端保证合法
+                    for item in payload:
+                        batch.append((MessageHeader.model_construct(
+                            msg_id=header.msg_id, msg_type=item["type"],
+                            correlation_id=None, timestamp=header.timestamp), item["data"]))
+                else:
+                    batch.append((header, payload))
+            except (ValidationError, Exception) as e:
+                self.signals.error.emit(f"Message decoding error: {e}")
 
 
 class WebSocketClient:
@@ -137,7 +174,6 @@ class WebSocketClient:
         self.thread_pool = QThreadPool.globalInstance()
 
         self.ws_worker = WebSocketWorker(self)
-        self.heartbeat_worker = HeartbeatWorker(self)
 
         self.lock = Lock()
         self._connected = False
@@ -164,8 +200,8 @@ class WebSocketClient:
             return self._connected and self.ws is not None
 
     def _setup_signals(self):
-        self.ws_worker.signals.message_received.connect(
-            self._on_message_received)
+        self.ws_worker.signals.messages_received.connect(
+            self._on_messages_received)
         self.ws_worker.signals.error.connect(
             lambda e: logger.error(f"WebSocket Error: {e}"))
         self.ws_worker.signals.connection_state.connect(
@@ -179,17 +215,18 @@ class WebSocketClient:
         if self.connection_cb:
             self.connection_cb(state)
 
-    @Slot(MessageHeader, dict)
-    def _on_message_received(self, header: MessageHeader, payload: dict):
-        if self.message_cb:
-            self.message_cb(header, payload)
+    @Slot(list)
+    def _on_messages_received(self, batch: List[Tuple[MessageHeader, Any]]):
+        message_cb = self.message_cb
+        if message_cb:
+            for header, payload in batch:
+                message_cb(header, payload)
 
     def run(self):
         """启动客户端。多次调用会先停止旧的 worker 再启动。"""
         with self.lock:
             if self._workers_started:
                 self.ws_worker.stop_event.set()
-                self.heartbeat_worker.stop_event.set()
                 self.thread_pool.waitForDone(1000) 
 
             if not self.uri:
@@ -197,10 +234,8 @@ class WebSocketClient:
                 return
 
             self.ws_worker.stop_event.clear()
-            self.heartbeat_worker.stop_event.clear()
 
             self.thread_pool.start(self.ws_worker)
-            self.thread_pool.start(self.heartbeat_worker)
             self._workers_started = True
 
     def send_raw_message(self, message: str) -> bool:
@@ -224,7 +259,6 @@ class WebSocketClient:
         """停止客户端"""
         logger.debug("Stopping WebSocket client...")
         self.ws_worker.stop_event.set()
-        self.heartbeat_worker.stop_event.set()
 
         with self.lock:
             if self.ws:
@@ -239,7 +273,6 @@ class WebSocketClient:
 
 
 class RequestDict(TypedDict):
-    timer: QTimer
     success_signal: Optional[SignalInstance]
     error_signal: Optional[SignalInstance]
 
@@ -256,13 +289,25 @@ class MessageHandler(QObject):
         super().__init__()
         self.client: Optional[WebSocketClient] = None
         self.config_manager = ConnectionConfigManager()
-        self.signal_dict: Dict[str, List[SignalInstance]] = defaultdict(list)
+        # 写时复制: 订阅变更时整体替换元组, 分发消息时无需加锁
+        self._sub_table: Dict[str, Tuple[SignalInstance, ...]] = {}
         self._pending_requests: Dict[str, RequestDict] = {}
         self._started_emitted_this_session = False
         self._requests_mutex = QMutex()
         self._subscriptions_mutex = QMutex()
         self._session_state_mutex = QMutex()
 
+        # 所有请求共享一个超时检查定时器, 截止时间存放在最小堆中
+        self._deadline_heap: List[Tuple[float, str]] = []
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setInterval(100)
+        self._timeout_timer.timeout.connect(self._check_timeouts)
+
+        # 心跳仅在连接期间由 Qt 线程上的定时器发送, 不再占用线程池
+        self._hb_timer = QTimer(self)
+        self._hb_timer.setInterval(5000)
+        self._hb_timer.timeout.connect(self._send_heartbeat)
+
     def _create_client(self):
         """创建并配置WebSocketClient实例"""
         if self.client:
@@ -274,6 +319,13 @@ class MessageHandler(QObject):
 
     def _handle_connection_change(self, is_connected: bool) -> None:
         """处理连接状态变化，用于触发 started 信号"""
+        if is_connected:
+            if not self._hb_timer.isActive():
+                self._send_heartbeat()
+                self._hb_timer.start()
+        else:
+            self._hb_timer.stop()
+
         with QMutexLocker(self._session_state_mutex):
             if is_connected and not self._started_emitted_this_session:
                 self.started.emit()
@@ -281,6 +333,16 @@ class MessageHandler(QObject):
             elif not is_connected:
                 self._started_emitted_this_session = False
 
+    def _send_heartbeat(self) -> None:
+        client = self.client
+        if not client or not client.is_connected():
+            return
+        try:
+            client.send_raw_message(
+                _HEARTBEAT_TEMPLATE % (_next_msg_id(), time.time()))
+        except Exception as e:
+            logger.error(f"Heartbeat error: {e}")
+
     def start(self) -> None:
         """
         启动消息处理器。
@@ -405,20 +467,21 @@ class MessageHandler(QObject):
 
     def stop(self) -> None:
         self.stopping.emit()
+        self._hb_timer.stop()
         if self.client:
             self.client.stop()
 
         with QMutexLocker(self._requests_mutex):
-            for msg_id, request_info in list(self._pending_requests.items()):
-                request_info["timer"].stop()
-                request_info["timer"].deleteLater()
+            while self._pending_requests:
+                _, request_info = self._pending_requests.popitem()
                 if error_signal := request_info.get("error_signal"):
                     try:
                         error_signal.emit(
                             "Client is shutting down. Request cancelled.")
                     except RuntimeError:
                         pass
-            self._pending_requests.clear()
+            self._deadline_heap.clear()
+        self._timeout_timer.stop()
 
         logger.info("ws会话终止")
 
@@ -437,30 +500,47 @@ class MessageHandler(QObject):
             else:
                 logger.error("Client not initialized. Cannot send request.")
             return
-        msg_id = str(uuid.uuid4())
-        timer = QTimer()
-        timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self._handle_timeout(msg_id))
+        msg_id = _next_msg_id()
 
         with QMutexLocker(self._requests_mutex):
             self._pending_requests[msg_id] = {
-                "timer": timer,
                 "success_signal": success_signal,
                 "error_signal": error_signal
             }
+            heapq.heappush(self._deadline_heap,
+                           (time.monotonic() + timeout, msg_id))
 
         header = MessageHeader(
             msg_id=msg_id, msg_type="request", correlation_id=msg_id, timestamp=time.time())
         payload = RequestPayload(method=method, params=params)
         message = ProtocolMessage.encode(header, payload.model_dump())
 
-        timer.start(int(timeout * 1000))
+        if not self._timeout_timer.isActive():
+            # send_request 可在任意线程调用, 定时器只能在其所属线程启动, 跨线程时排队执行
+            QMetaObject.invokeMethod(
+                self._timeout_timer, "start", Qt.ConnectionType.AutoConnection)
 
         if not self.client.send_raw_message(message):
             self._cleanup_request(msg_id)
             if error_signal:
                 error_signal.emit("Failed to send request: Not connected")
 
+    def _check_timeouts(self):
+        """弹出所有已到期的请求并触发超时处理"""
+        now = time.monotonic()
+        expired: List[str] = []
+        with QMutexLocker(self._requests_mutex):
+            heap = self._deadline_heap
+            while heap and heap[0][0] <= now:
+                _, msg_id = heapq.heappop(heap)
+                if msg_id in self._pending_requests:
+                    expired.append(msg_id)
+            if not heap:
+                self._timeout_timer.stop()
+
+        for msg_id in expired:
+            self._handle_timeout(msg_id)
+
     def _handle_timeout(self, msg_id: str):
         with QMutexLocker(self._requests_mutex):
             if msg_id in self._pending_requests:
@@ -475,33 +555,21 @@ class MessageHandler(QObject):
             logger.warning(
                 f"Request timeout for {msg_id} with no error signal.")
 
-        request_info["timer"].deleteLater()
-
     def _cleanup_request(self, msg_id: str):
         """线程安全地清理请求资源"""
         with QMutexLocker(self._requests_mutex):
-            if msg_id in self._pending_requests:
-                request_info = self._pending_requests.pop(msg_id)
-                request_info["timer"].stop()
-                request_info["timer"].deleteLater()
+            self._pending_requests.pop(msg_id, None)
 
     def sort_data(self, header: MessageHeader, payload: Dict) -> None:
         if header.msg_type == "response" and header.correlation_id:
             self._handle_response(header.correlation_id, payload)
         else:
-            with QMutexLocker(self._subscriptions_mutex):
-                signals_to_emit = list(
-                    self.signal_dict.get(header.msg_type, []))
-
-            for signal in signals_to_emit:
+            for signal in self._sub_table.get(header.msg_type, ()):
                 try:
                     signal.emit(header.msg_type, payload)
                 except RuntimeError as e:
                     if "deleted" in str(e).lower():
-                        with QMutexLocker(self._subscriptions_mutex):
-                            if signal in self.signal_dict[header.msg_type]:
-                                self.signal_dict[header.msg_type].remove(
-                                    signal)
+                        self._remove_subscription(header.msg_type, signal)
                     else:
                         raise e
 
@@ -523,7 +591,7 @@ class MessageHandler(QObject):
         """
 
         header = MessageHeader(
-            msg_id=f"fake-{uuid.uuid4()}",
+            msg_id=f"fake-{_next_msg_id()}",
             msg_type=msg_type,
             timestamp=time.time(),
             correlation_id=correlation_id
@@ -535,8 +603,6 @@ class MessageHandler(QObject):
             if msg_id not in self._pending_requests:
                 return
             request_info = self._pending_requests.pop(msg_id)
-            request_info["timer"].stop()
-            request_info["timer"].deleteLater()
 
         response = ResponsePayload(**payload)
         try:
@@ -558,7 +624,9 @@ class MessageHandler(QObject):
             raise ValueError("At least one type required")
         with QMutexLocker(self._subscriptions_mutex):
             for type_ in types:
-                self.signal_dict[type_].append(signal)
+                current = self._sub_table.get(type_, ())
+                if signal not in current:
+                    self._sub_table[type_] = current + (signal,)
 
     def unsubscribe(self, signal: SignalInstance, *types: str) -> None:
         """
@@ -569,22 +637,19 @@ class MessageHandler(QObject):
             *types (str): 可选参数。要取消订阅的特定消息类型。
                           如果未提供，则会从所有消息类型中移除该信号。
         """
-        with QMutexLocker(self._subscriptions_mutex):
-            if not types:
-                for type_key in list(self.signal_dict.keys()):
-                    while signal in self.signal_dict[type_key]:
-                        self.signal_dict[type_key].remove(signal)
+        for type_ in types or tuple(self._sub_table):
+            self._remove_subscription(type_, signal)
 
-                    if not self.signal_dict[type_key]:
-                        del self.signal_dict[type_key]
+    def _remove_subscription(self, type_: str, signal: SignalInstance) -> None:
+        with QMutexLocker(self._subscriptions_mutex):
+            current = self._sub_table.get(type_)
+            if current is None or signal not in current:
+                return
+            remaining = tuple(s for s in current if s != signal)
+            if remaining:
+                self._sub_table[type_] = remaining
             else:
-                for type_ in types:
-                    if type_ in self.signal_dict:
-                        while signal in self.signal_dict[type_]:
-                            self.signal_dict[type_].remove(signal)
-
-                        if not self.signal_dict[type_]:
-                            del self.signal_dict[type_]
+                del self._sub_table[type_]
 
 
 # 全局实例
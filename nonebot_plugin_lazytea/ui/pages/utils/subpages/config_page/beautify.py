@@ -3,6 +3,217 @@ from PySide6.QtWidgets import (QWidget, QLabel, QPushButton, QLineEdit,
                                QGroupBox, QScrollArea)
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
+from typing import Any, Callable, Dict
+
+
+_LABEL_QSS = """
+    QLabel {
+        background-color: #ffffff;
+        color: #495057;
+        font-size: 14px;
+        padding: 2px 0px;
+    }
+    QLabel[class="description"] {
+        color: #6c757d;
+        font-size: 13px;
+        padding: 2px 0px 8px 0px;
+    }
+    QLabel[class="error-label"] {
+        color: #dc3545;
+        font-size: 12px;
+        padding: 4px 0px 0px 0px;
+    }
+    QLabel[class="type-hint"] {
+        color: #4a6fa5;
+        font-size: 13px;
+        font-weight: 500;
+        padding: 8px 0px 12px 15px;
+        background-color: rgba(234, 241, 247, 153);
+        border-radius: 8px;
+        margin: 5px 0px;
+    }
+"""
+
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: #ffffff;
+        color: #212529;
+        border: 1px solid rgba(206, 212, 218, 179);
+        border-bottom: 2px solid rgba(173, 181, 189, 153);
+        border-radius: 15px;
+        padding: 8px 16px;
+        min-width: 80px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: rgba(248, 249, 250, 230);
+        border-color: rgba(173, 181, 189, 204);
+    }
+    QPushButton:pressed {
+        background-color: rgba(206, 212, 218, 230);
+    }
+    QPushButton:disabled {
+        background-color: rgba(248, 249, 250, 179);
+        color: #adb5bd;
+    }
+    QPushButton[special="true"] {
+        border: 1px dashed rgba(108, 117, 125, 179);
+        background-color: rgba(255, 255, 255, 128);
+    }
+    QPushButton[action="true"] {
+        background-color: rgba(77, 171, 247, 230);
+        color: #ffffff;
+        border: 1px solid rgba(51, 154, 240, 230);
+    }
+"""
+
+_INPUT_FIELD_QSS = """
+    QLineEdit, QSpinBox, QDoubleSpinBox {
+        background-color: #ffffff;
+        border: 1px solid #ced4da;
+        border-bottom: 2px solid rgba(173, 181, 189, 153);
+        border-radius: 12px;
+        padding: 8px 12px;
+        font-size: 14px;
+        min-width: 120px;
+        color: #000000;
+    }
+    QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {
+        border: 2px solid #4dabf7;
+        background-color: #f8f9fa;
+    }
+    QSpinBox::up-button, QDoubleSpinBox::up-button {
+        subcontrol-origin: border;
+        subcontrol-position: top right;
+        width: 20px;
+    }
+    QSpinBox::down-button, QDoubleSpinBox::down-button {
+        subcontrol-origin: border;
+        subcontrol-position: bottom right;
+        width: 20px;
+    }
+"""
+
+_COMBO_BOX_QSS = """
+    QComboBox {
+        background-color: #ffffff;
+        border: 1px solid #ced4da;
+        border-radius: 12px;
+        padding: 8px 12px;
+        font-size: 14px;
+        min-width: 120px;
+        color: #000000;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 25px;
+        border-left-width: 1px;
+        border-left-color: #ced4da;
+        border-left-style: solid;
+        border-top-right-radius: 12px;
+        border-bottom-right-radius: 12px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #ffffff;
+        border: 1px solid #ced4da;
+        selection-background-color: #4dabf7;
+        selection-color: #ffffff;
+        outline: 0px;
+        color: #000000;
+    }
+"""
+
+_CHECK_BOX_QSS = """
+    QCheckBox {
+        background-color: #ffffff;
+        spacing: 10px;
+        font-size: 14px;
+        color: #2c3e50;
+        padding: 8px 0px;
+    }
+    QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #adb5bd;
+        border-radius: 6px;
+        background-color: #ffffff;
+    }
+    QCheckBox::indicator:checked {
+        border: 2px solid #4dabf7;
+    }
+    QCheckBox::indicator:disabled {
+        border: 2px solid #e9ecef;
+    }
+"""
+
+_RADIO_BUTTON_QSS = """
+    QRadioButton {
+        background-color: #ffffff;
+        spacing: 10px;
+        font-size: 14px;
+        color: #495057;
+        margin-left: 10px;
+        padding: 6px 0px;
+    }
+    QRadioButton::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #adb5bd;
+        border-radius: 10px;
+        background-color: #ffffff;
+    }
+    QRadioButton::indicator:checked {
+        background-color: #4dabf7;
+        border: 2px solid #4dabf7;
+    }
+    QRadioButton::indicator:disabled {
+        border: 2px solid #e9ecef;
+    }
+"""
+
+_GROUP_BOX_QSS = """
+    QGroupBox {
+        background-color: #ffffff;
+        border: 1px solid #dee2e6;
+        border-radius: 15px;
+        margin-top: 10px;
+        padding-top: 20px;
+        font-size: 15px;
+        font-weight: 500;
+        color: #343a40;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0px 5px;
+    }
+"""
+
+_SCROLL_AREA_QSS = """
+    QScrollArea {
+        background-color: #ffffff;
+        border: none;
+    }
+    QScrollBar:vertical {
+        background: #ffffff;
+        width: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #ced4da;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: transparent;
+    }
+"""
+
+_BASE_BACKGROUND = QColor("#ffffff")
 
 
 class StyleManager:
@@ -11,237 +222,50 @@ class StyleManager:
     @staticmethod
     def apply_base_style(widget: QWidget) -> None:
         palette = widget.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor("#ffffff"))
+        palette.setColor(QPalette.ColorRole.Window, _BASE_BACKGROUND)
         widget.setAutoFillBackground(True)
         widget.setPalette(palette)
 
     @staticmethod
     def apply_style(widget: QWidget) -> None:
-        if isinstance(widget, QLabel):
-            StyleManager.style_label(widget)
-        elif isinstance(widget, QPushButton):
-            StyleManager.style_button(widget)
-        elif isinstance(widget, (QLineEdit, QSpinBox, QDoubleSpinBox)):
-            StyleManager.style_input_field(widget)
-        elif isinstance(widget, QComboBox):
-            StyleManager.style_combo_box(widget)
-        elif isinstance(widget, QCheckBox):
-            StyleManager.style_check_box(widget)
-        elif isinstance(widget, QRadioButton):
-            StyleManager.style_radio_button(widget)
-        elif isinstance(widget, QGroupBox):
-            StyleManager.style_group_box(widget)
-        elif isinstance(widget, QScrollArea):
-            StyleManager.style_scroll_area(widget)
+        widget_type = type(widget)
+        styler = _STYLERS.get(widget_type)
+        if styler is None:
+            # 子类沿 MRO 查找一次后按类型缓存，未命中缓存为空操作
+            styler = next((_STYLERS[cls] for cls in widget_type.__mro__[1:]
+                           if cls in _STYLERS), _noop_styler)
+            _STYLERS[widget_type] = styler
+        styler(widget)
 
     @staticmethod
     def style_label(label: QLabel) -> None:
-        label.setStyleSheet("""
-            QLabel {
-                background-color: #ffffff;
-                color: #495057;
-                font-size: 14px;
-                padding: 2px 0px;
-            }
-            QLabel[class="description"] {
-                color: #6c757d;
-                font-size: 13px;
-                padding: 2px 0px 8px 0px;
-            }
-            QLabel[class="error-label"] {
-                color: #dc3545;
-                font-size: 12px;
-                padding: 4px 0px 0px 0px;
-            }
-            QLabel[class="type-hint"] {
-                color: #4a6fa5;
-                font-size: 13px;
-                font-weight: 500;
-                padding: 8px 0px 12px 15px;
-                background-color: rgba(234, 241, 247, 153);
-                border-radius: 8px;
-                margin: 5px 0px;
-            }
-        """)
+        label.setStyleSheet(_LABEL_QSS)
 
     @staticmethod
     def style_button(button: QPushButton) -> None:
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #ffffff;
-                color: #212529;
-                border: 1px solid rgba(206, 212, 218, 179);
-                border-radius: 15px;
-                padding: 8px 16px;
-                min-width: 80px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(248, 249, 250, 230);
-                border-color: rgba(173, 181, 189, 204);
-            }
-            QPushButton:pressed {
-                background-color: rgba(206, 212, 218, 230);
-            }
-            QPushButton:disabled {
-                background-color: rgba(248, 249, 250, 179);
-                color: #adb5bd;
-            }
-            QPushButton[special="true"] {
-                border: 1px dashed rgba(108, 117, 125, 179);
-                background-color: rgba(255, 255, 255, 128);
-            }
-            QPushButton[action="true"] {
-                background-color: rgba(77, 171, 247, 230);
-                color: #ffffff;
-                border: 1px solid rgba(51, 154, 240, 230);
-            }
-        """)
-
-        shadow = QGraphicsDropShadowEffect(button)
-        shadow.setBlurRadius(8)
-        shadow.setColor(QColor(0, 0, 0, 25))
-        shadow.setOffset(0, 3)
-        button.setGraphicsEffect(shadow)
+        button.setStyleSheet(_BUTTON_QSS)
 
     @staticmethod
     def style_input_field(field: QWidget) -> None:
-        field.setStyleSheet("""
-            QLineEdit, QSpinBox, QDoubleSpinBox {
-                background-color: #ffffff;
-                border: 1px solid #ced4da;
-                border-radius: 12px;
-                padding: 8px 12px;
-                font-size: 14px;
-                min-width: 120px;
-                color: #000000;
-            }
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {
-                border: 2px solid #4dabf7;
-                background-color: #f8f9fa;
-            }
-            QSpinBox::up-button, QDoubleSpinBox::up-button {
-                subcontrol-origin: border;
-                subcontrol-position: top right;
-                width: 20px;
-            }
-            QSpinBox::down-button, QDoubleSpinBox::down-button {
-                subcontrol-origin: border;
-                subcontrol-position: bottom right;
-                width: 20px;
-            }
-        """)
-
-        shadow = QGraphicsDropShadowEffect(field)
-        shadow.setBlurRadius(6)
-        shadow.setColor(QColor(0, 0, 0, 20))
-        shadow.setOffset(0, 2)
-        field.setGraphicsEffect(shadow)
+        field.setStyleSheet(_INPUT_FIELD_QSS)
 
     @staticmethod
     def style_combo_box(combo: QComboBox) -> None:
-        combo.setStyleSheet("""
-            QComboBox {
-                background-color: #ffffff;
-                border: 1px solid #ced4da;
-                border-radius: 12px;
-                padding: 8px 12px;
-                font-size: 14px;
-                min-width: 120px;
-                color: #000000;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 25px;
-                border-left-width: 1px;
-                border-left-color: #ced4da;
-                border-left-style: solid;
-                border-top-right-radius: 12px;
-                border-bottom-right-radius: 12px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                border: 1px solid #ced4da;
-                selection-background-color: #4dabf7;
-                selection-color: #ffffff;
-                outline: 0px;
-                color: #000000;
-            }
-        """)
+        combo.setStyleSheet(_COMBO_BOX_QSS)
 
     @staticmethod
     def style_check_box(check_box: QCheckBox) -> None:
-        check_box.setStyleSheet("""
-            QCheckBox {
-                background-color: #ffffff;
-                spacing: 10px;
-                font-size: 14px;
-                color: #2c3e50;
-                padding: 8px 0px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #adb5bd;
-                border-radius: 6px;
-                background-color: #ffffff;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #4dabf7;
-            }
-            QCheckBox::indicator:disabled {
-                border: 2px solid #e9ecef;
-            }
-        """)
+        check_box.setStyleSheet(_CHECK_BOX_QSS)
 
     @staticmethod
     def style_radio_button(radio: QRadioButton) -> None:
-        radio.setStyleSheet("""
-            QRadioButton {
-                background-color: #ffffff;
-                spacing: 10px;
-                font-size: 14px;
-                color: #495057;
-                margin-left: 10px;
-                padding: 6px 0px;
-            }
-            QRadioButton::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #adb5bd;
-                border-radius: 10px;
-                background-color: #ffffff;
-            }
-            QRadioButton::indicator:checked {
-                background-color: #4dabf7;
-                border: 2px solid #4dabf7;
-            }
-            QRadioButton::indicator:disabled {
-                border: 2px solid #e9ecef;
-            }
-        """)
+        radio.setStyleSheet(_RADIO_BUTTON_QSS)
 
     @staticmethod
     def style_group_box(group_box: QGroupBox) -> None:
-        group_box.setStyleSheet("""
-            QGroupBox {
-                background-color: #ffffff;
-                border: 1px solid #dee2e6;
-                border-radius: 15px;
-                margin-top: 10px;
-                padding-top: 20px;
-                font-size: 15px;
-                font-weight: 500;
-                color: #343a40;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0px 5px;
-            }
-        """)
+        group_box.setStyleSheet(_GROUP_BOX_QSS)
 
+        # 阴影只挂在外层分组容器上, 子控件使用 QSS 底边模拟阴影, 避免逐控件离屏模糊
         shadow = QGraphicsDropShadowEffect(group_box)
         shadow.setBlurRadius(10)
         shadow.setColor(QColor(0, 0, 0, 25))
@@ -250,25 +274,22 @@ class StyleManager:
 
     @staticmethod
     def style_scroll_area(scroll_area: QScrollArea) -> None:
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: #ffffff;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: #ffffff;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #ced4da;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-        """)
+        scroll_area.setStyleSheet(_SCROLL_AREA_QSS)
+
+
+def _noop_styler(widget: QWidget) -> None:
+    pass
+
+
+_STYLERS: Dict[type, Callable[[Any], None]] = {
+    QLabel: StyleManager.style_label,
+    QPushButton: StyleManager.style_button,
+    QLineEdit: StyleManager.style_input_field,
+    QSpinBox: StyleManager.style_input_field,
+    QDoubleSpinBox: StyleManager.style_input_field,
+    QComboBox: StyleManager.style_combo_box,
+    QCheckBox: StyleManager.style_check_box,
+    QRadioButton: StyleManager.style_radio_button,
+    QGroupBox: StyleManager.style_group_box,
+    QScrollArea: StyleManager.style_scroll_area,
+}
@@ -1,5 +1,5 @@
 import orjson
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 from pydantic import BaseModel, Field, ValidationError
 import time
 
@@ -34,31 +34,64 @@ class ProtocolMessage:
     """WebSocket 协议消息处理器"""
     VERSION = "1.0"
     SEPARATOR = "\x1e"  # ASCII Record Separator
+    SEPARATOR_B = SEPARATOR.encode()
 
     @classmethod
-    def encode(cls, header: MessageHeader, payload: Any) -> str:
-        """编码结构化消息
+    def encode(cls, header: Union[MessageHeader, Dict[str, Any]], payload: Any) -> str:
+        """编码结构化消息, header 可为已知合法的字典以跳过模型构建
         Example:
             >>> header = MessageHeader(msg_id="123", msg_type="request", timestamp=time.time())
             >>> ProtocolMessage.encode(header, {"method": "ping"})
         """
+        return cls.encode_bytes(header, payload).decode("utf-8")
+
+    @classmethod
+    def encode_bytes(cls, header: Union[MessageHeader, Dict[str, Any]], payload: Any) -> bytes:
+        """编码为 UTF-8 字节, 用于二进制帧, 省去一次 str 转换
+        Example:
+            >>> ProtocolMessage.encode_bytes(header, {"method": "ping"})
+        """
+        message = {
+            "version": cls.VERSION,
+            "header": header if isinstance(header, dict) else header.model_dump(),
+            "payload": payload
+        }
+        return orjson.dumps(message, default=default) + cls.SEPARATOR_B
+
+    @classmethod
+    def build_template(cls, msg_type: str, payload: Any) -> str:
+        """预编码除 msg_id 与 timestamp 外的全部字段, 适用于负载固定的高频消息
+        Example:
+            >>> template = ProtocolMessage.build_template("heartbeat", {"status": "alive"})
+            >>> template % ("a1b2c3d4", time.time())
+        """
         message = {
             "version": cls.VERSION,
-            "header": header.model_dump(),
+            "header": {
+                "msg_id": "__msg_id__",
+                "msg_type": msg_type,
+                "correlation_id": None,
+                "timestamp": "__timestamp__",
+            },
             "payload": payload
         }
-        return orjson.dumps(message, default=default).decode("utf-8") + cls.SEPARATOR
+        encoded = orjson.dumps(message, default=default).decode("utf-8")
+        return (encoded.replace("%", "%%")
+                .replace('"__msg_id__"', '"%s"', 1)
+                .replace('"__timestamp__"', "%r", 1)) + cls.SEPARATOR
 
     @classmethod
-    def decode(cls, raw_data: str) -> Tuple[Optional[MessageHeader], Any]:
-        """解码结构化消息
+    def decode(cls, raw_data: Union[str, bytes]) -> Tuple[Optional[MessageHeader], Any]:
+        """解码结构化消息, 接受 str 或 bytes
         Example:
             >>> raw = '{"version":"1.0","header":{"msg_id":"123","msg_type":"request",...}}\x1e'
             >>> ProtocolMessage.decode(raw)
         """
         try:
-            data = orjson.loads(raw_data.strip(cls.SEPARATOR))
-            header = MessageHeader(**data["header"])
+            if raw_data[-1:] in (cls.SEPARATOR, cls.SEPARATOR_B):
+                raw_data = raw_data[:-1]
+            data = orjson.loads(raw_data)
+            header = MessageHeader.model_validate(data["header"])
             return header, data.get("payload")
         except (orjson.JSONDecodeError, KeyError, ValidationError) as e:
             return None, None
@@ -1,11 +1,24 @@
 import asyncio
-from typing import Dict
+from typing import Callable, Dict
 from collections import defaultdict
 
 server_send_queue = asyncio.Queue()
 
+_listening_checker: Callable[[], bool] = lambda: True
+
 
 async def send_event(type: str, data: Dict):
     await server_send_queue.put((type, data))
 
+
+def set_listening_checker(checker: Callable[[], bool]) -> None:
+    """注册用于判断是否仍有UI端需要接收事件的回调"""
+    global _listening_checker
+    _listening_checker = checker
+
+
+def is_ui_connected() -> bool:
+    """是否有UI端正在或即将接收事件, 为False时可跳过事件数据的构建"""
+    return _listening_checker()
+
 bot_off_line = defaultdict(set)  # platform | set(bot_id)
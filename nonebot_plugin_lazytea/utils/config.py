@@ -14,6 +14,9 @@ class Config(BaseModel):
 
     headless: bool = Field(False, description="是否启用无头模式")
 
+    buffer_until_connect: bool = Field(
+        True, description="UI连接前是否缓存启动后60秒内的消息,关闭后无UI连接时事件将被直接跳过")
+
     @property
     def environment(self):
         return get_driver().env
@@ -1,8 +1,9 @@
 import ast
-import hashlib
 import inspect
 from typing import Callable, Dict, Set
 import textwrap
+import xxhash
+from types import CodeType
 
 
 class CacheForFingerprint:
@@ -24,6 +25,30 @@ class CacheForFingerprint:
         return raw_set - to_remove
 
 
+def _code_fingerprint(func: Callable) -> str:
+    """基于字节码的指纹, 仅在拿不到源码时使用, 跨Python版本不保证稳定"""
+    code = getattr(getattr(func, "__func__", func), "__code__", None)
+    if code is None:
+        raise ValueError("提供的对象既无源码也无字节码")
+
+    hash_obj = xxhash.xxh3_64()
+    stack = [code]
+    while stack:
+        current = stack.pop()
+        hash_obj.update(current.co_code)
+        for const in current.co_consts:
+            if isinstance(const, CodeType):
+                stack.append(const)
+            elif isinstance(const, frozenset):
+                # 集合字面量的迭代顺序受哈希随机化影响, 需排序后再参与计算
+                hash_obj.update(repr(sorted(map(repr, const))).encode('utf-8'))
+            else:
+                hash_obj.update(repr(const).encode('utf-8'))
+        hash_obj.update(repr(current.co_names).encode('utf-8'))
+        hash_obj.update(repr(current.co_varnames).encode('utf-8'))
+    return hash_obj.hexdigest()
+
+
 def get_function_fingerprint(plugin_name: str, func: Callable) -> str:
     """
     获取Python函数的稳定特征指纹
@@ -32,7 +57,8 @@ def get_function_fingerprint(plugin_name: str, func: Callable) -> str:
         func: 要分析的函数对象
 
     返回:
-        返回一个SHA256哈希字符串，在不同平台和Python版本下对相同函数逻辑保持稳定
+        返回一个xxh3_64哈希字符串，在不同平台和Python版本下对相同函数逻辑保持稳定;
+        无法获取源码时退化为字节码指纹, 此时仅在同一Python版本下稳定
 
     异常:
         ValueError: 当输入不是函数或无法解析函数时抛出
@@ -41,18 +67,31 @@ def get_function_fingerprint(plugin_name: str, func: Callable) -> str:
         if func in CacheForFingerprint.cache:
             return CacheForFingerprint.cache[func]
 
-        source = inspect.getsource(func)
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            hash_final = _code_fingerprint(func)
+            CacheForFingerprint.store(plugin_name, func, hash_final)
+            return hash_final
+
         dedented_source = textwrap.dedent(source)
         tree = ast.parse(dedented_source)
 
-        if not isinstance(tree.body[0], (ast.FunctionDef, ast.AsyncFunctionDef)):
+        func_node = tree.body[0]
+        if not isinstance(func_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             raise ValueError("提供的对象不是函数定义")
 
-        ast_dump = ast.dump(tree, annotate_fields=False,
-                            include_attributes=False)
-
-        hash_obj = hashlib.sha256()
-        hash_obj.update(ast_dump.encode('utf-8'))
+        # 逐个节点送入哈希, 避免拼出整棵语法树的完整字符串
+        hash_obj = xxhash.xxh3_64()
+        hash_obj.update(f"{type(func_node).__name__}:{func_node.name}\n".encode('utf-8'))
+        nodes = [func_node.args, *func_node.decorator_list]
+        if func_node.returns is not None:
+            nodes.append(func_node.returns)
+        nodes.extend(func_node.body)
+        for node in nodes:
+            hash_obj.update(ast.dump(node, annotate_fields=False,
+                                     include_attributes=False).encode('utf-8'))
+            hash_obj.update(b"\n")
         hash_final = hash_obj.hexdigest()
         CacheForFingerprint.store(plugin_name, func, hash_final)
         return hash_final
@@ -1,5 +1,6 @@
-from typing import Dict, Set, Tuple, Optional, FrozenSet, Any, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict, field_serializer, model_serializer
+from typing import Callable, Dict, Set, Tuple, Type, Optional, FrozenSet, Any, List, Union
+from weakref import WeakKeyDictionary
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, ConfigDict, field_serializer, model_serializer
 from nonebot.matcher import Matcher
 from nonebot.rule import (
     CommandRule, ShellCommandRule, RegexRule, KeywordsRule,
@@ -9,6 +10,49 @@ from nonebot_plugin_alconna.rule import AlconnaRule
 import orjson
 import xxhash
 
+_rule_cache: "WeakKeyDictionary[Type[Matcher], RuleData]" = WeakKeyDictionary()
+
+_RULE_SET_FIELDS = (
+    "commands", "shell_commands", "regex_patterns", "keywords",
+    "startswith", "endswith", "fullmatch", "event_types", "alconna_commands",
+)
+
+
+_RuleHandler = Callable[[Any, Dict[str, Any]], None]
+
+
+def _set_to_me(rule_call: Any, data: Dict[str, Any]) -> None:
+    data["to_me"] = True
+
+
+_RULE_HANDLERS: Dict[type, Optional[_RuleHandler]] = {
+    CommandRule: lambda rc, data: data["commands"].update(tuple(cmd) for cmd in rc.cmds),
+    ShellCommandRule: lambda rc, data: data["shell_commands"].update(tuple(cmd) for cmd in rc.cmds),
+    RegexRule: lambda rc, data: data["regex_patterns"].add(rc.regex),
+    KeywordsRule: lambda rc, data: data["keywords"].update(rc.keywords),
+    StartswithRule: lambda rc, data: data["startswith"].update(rc.msg),
+    EndswithRule: lambda rc, data: data["endswith"].update(rc.msg),
+    FullmatchRule: lambda rc, data: data["fullmatch"].update(rc.msg),
+    IsTypeRule: lambda rc, data: data["event_types"].update(t.__name__ for t in rc.types),
+    ToMeRule: _set_to_me,
+    AlconnaRule: lambda rc, data: data["alconna_commands"].add(rc._path.removeprefix("Alconna::")),
+}
+
+
+def _get_rule_handler(rule_type: type) -> Optional[_RuleHandler]:
+    """按类型取规则处理函数，子类沿 MRO 查找后缓存"""
+    try:
+        return _RULE_HANDLERS[rule_type]
+    except KeyError:
+        pass
+    handler = None
+    for base in rule_type.__mro__[1:]:
+        handler = _RULE_HANDLERS.get(base)
+        if handler is not None:
+            break
+    _RULE_HANDLERS[rule_type] = handler
+    return handler
+
 
 class RuleData(BaseModel):
     """规则数据模型，支持序列化和比较"""
@@ -24,7 +68,13 @@ class RuleData(BaseModel):
     event_types: FrozenSet[str] = Field(default_factory=frozenset)
     to_me: bool = False
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    _hash: int = PrivateAttr(default=0)
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def model_post_init(self, __context: Any) -> None:
+        # 字段不可变，构造时即缓存哈希；相等实例的缓存值必然相同，不影响 __eq__
+        self._hash = self._quick_hash()
 
     @field_serializer('commands', 'shell_commands')
     def serialize_commands(self, value: FrozenSet[Tuple[str, ...]], _info) -> List[List[str]]:
@@ -57,39 +107,44 @@ class RuleData(BaseModel):
         保证哈希值在不同环境、不同时间下的一致性。
         """
         hash_obj = xxhash.xxh64()
-        all_data = []
-        for cmd in self.commands:
-            all_data.append(f"cmd:{str(tuple(cmd))}")
-        for shell_cmd in self.shell_commands:
-            all_data.append(f"scmd:{str(tuple(shell_cmd))}")
-        for pattern in self.regex_patterns:
-            all_data.append(f"re:{pattern}")
-        for keyword in self.keywords:
-            all_data.append(f"kw:{keyword}")
-        for prefix in self.startswith:
-            all_data.append(f"sw:{prefix}")
-        for suffix in self.endswith:
-            all_data.append(f"ew:{suffix}")
-        for full in self.fullmatch:
-            all_data.append(f"fm:{full}")
-        for event_type in self.event_types:
-            all_data.append(f"evt:{event_type}")
-        for alc_cmd in self.alconna_commands:
-            all_data.append(f"alc:{alc_cmd}")
-        all_data.append(f"tome:{str(self.to_me)}")
-
-        all_data.sort()
-
-        for item in all_data:
-            hash_obj.update(item.encode('utf-8'))
+        update = hash_obj.update
+        for tag, cmds in ((b"\x01", self.commands), (b"\x02", self.shell_commands)):
+            for cmd in sorted(cmds):
+                update(tag)
+                update("\x00".join(cmd).encode('utf-8'))
+        for tag, values in (
+            (b"\x03", self.regex_patterns),
+            (b"\x04", self.keywords),
+            (b"\x05", self.startswith),
+            (b"\x06", self.endswith),
+            (b"\x07", self.fullmatch),
+            (b"\x08", self.event_types),
+            (b"\x09", self.alconna_commands),
+        ):
+            for value in sorted(values):
+                update(tag)
+                update(value.encode('utf-8'))
+        update(b"\x0a\x01" if self.to_me else b"\x0a\x00")
 
         return int.from_bytes(hash_obj.digest(), byteorder='big')
 
     def __hash__(self) -> int:
-        return self._quick_hash()
+        return self._hash
+
+    @field_validator("commands", "shell_commands", mode="before")
+    @classmethod
+    def ensure_command_frozenset(cls, v: Any) -> FrozenSet:
+        """确保命令转换为元组的不可变集合，JSON 中的命令为列表"""
+        if v is None:
+            return frozenset()
+        if isinstance(v, frozenset):
+            return v
+        if isinstance(v, (set, list, tuple)):
+            return frozenset(tuple(cmd) if isinstance(cmd, list) else cmd for cmd in v)
+        return frozenset({v})
 
     @field_validator(
-        "commands", "shell_commands", "regex_patterns", "keywords",
+        "regex_patterns", "keywords",
         "startswith", "endswith", "fullmatch", "event_types", "alconna_commands",
         mode="before"
     )
@@ -105,58 +160,56 @@ class RuleData(BaseModel):
         return frozenset({v})
 
     @classmethod
-    def extract_rule(cls, matcher: Matcher) -> "RuleData":
-        """从Matcher对象中提取规则数据"""
-        commands = set()
-        shell_commands = set()
-        regex_patterns = set()
-        keywords = set()
-        startswith = set()
-        endswith = set()
-        fullmatch = set()
-        event_types = set()
-        alconna_commands = set()
-        to_me = False
+    def extract_rule(cls, matcher: Union[Matcher, Type[Matcher]]) -> "RuleData":
+        """从Matcher对象中提取规则数据，按 Matcher 类缓存"""
+        if isinstance(matcher, Matcher):
+            matcher_type = type(matcher)
+        else:
+            matcher_type = matcher
+        rule_data = _rule_cache.get(matcher_type)
+        if rule_data is None:
+            rule_data = _rule_cache[matcher_type] = cls._extract_rule(
+                matcher_type)
+        return rule_data
+
+    @classmethod
+    def _extract_rule(cls, matcher: Type[Matcher]) -> "RuleData":
+        data: Dict[str, Any] = {field: set() for field in _RULE_SET_FIELDS}
+        data["to_me"] = False
 
         for checker in matcher.rule.checkers:
             if not hasattr(checker, "call"):
                 continue
 
             rule_call = checker.call
+            handler = _get_rule_handler(type(rule_call))
+            if handler is not None:
+                handler(rule_call, data)
 
-            if isinstance(rule_call, CommandRule):
-                commands.update(tuple(cmd) for cmd in rule_call.cmds)
-            elif isinstance(rule_call, ShellCommandRule):
-                shell_commands.update(tuple(cmd) for cmd in rule_call.cmds)
-            elif isinstance(rule_call, RegexRule):
-                regex_patterns.add(rule_call.regex)
-            elif isinstance(rule_call, KeywordsRule):
-                keywords.update(rule_call.keywords)
-            elif isinstance(rule_call, StartswithRule):
-                startswith.update(rule_call.msg)
-            elif isinstance(rule_call, EndswithRule):
-                endswith.update(rule_call.msg)
-            elif isinstance(rule_call, FullmatchRule):
-                fullmatch.update(rule_call.msg)
-            elif isinstance(rule_call, IsTypeRule):
-                event_types.update(t.__name__ for t in rule_call.types)
-            elif isinstance(rule_call, ToMeRule):
-                to_me = True
-            elif isinstance(rule_call, AlconnaRule):
-                alconna_commands.add(rule_call._path.removeprefix("Alconna::"))
-
-        return cls(
-            commands=commands,  # type: ignore
-            shell_commands=shell_commands,  # type: ignore
-            regex_patterns=regex_patterns,  # type: ignore
-            keywords=keywords,  # type: ignore
-            startswith=startswith,  # type: ignore
-            endswith=endswith,  # type: ignore
-            fullmatch=fullmatch,  # type: ignore
-            event_types=event_types,  # type: ignore
-            alconna_commands=alconna_commands,  # type: ignore
-            to_me=to_me
-        )
+        return cls(**data)
+
+
+_PERM_LIST_KEYS = frozenset({"white_list", "ban_list"})
+_PERM_ID_KEYS = frozenset({"user", "group"})
+_PERM_HASH_SECTIONS = (
+    (b"\x01", "ban_list", "group"),
+    (b"\x02", "ban_list", "user"),
+    (b"\x03", "white_list", "group"),
+    (b"\x04", "white_list", "user"),
+)
+
+
+def _is_frozen_permission(v: Any) -> bool:
+    """权限数据是否已是校验后的形状"""
+    if not isinstance(v, dict) or v.keys() != _PERM_LIST_KEYS:
+        return False
+    for inner in v.values():
+        if not isinstance(inner, dict) or inner.keys() != _PERM_ID_KEYS:
+            return False
+        for ids in inner.values():
+            if not isinstance(ids, frozenset):
+                return False
+    return True
 
 
 class MatcherInfo(BaseModel):
@@ -170,7 +223,13 @@ class MatcherInfo(BaseModel):
     )
     is_on: bool = True
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    _hash: int = PrivateAttr(default=0)
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    def model_post_init(self, __context: Any) -> None:
+        # 同 RuleData，构造时缓存哈希；model_copy(update=...) 不会重新计算，需重新构造
+        self._hash = self._quick_hash()
 
     def _quick_hash(self) -> int:
         """
@@ -197,23 +256,24 @@ class MatcherInfo(BaseModel):
         持久化哈希方法。
         """
         hash_obj = xxhash.xxh64()
-        hash_obj.update(str(self.rule._persist_hash()).encode('utf-8'))
-
-        perm_data = []
-        for perm_type in sorted(self.permission.keys()):  # white_list, ban_list
-            # group, user
-            for id_type in sorted(self.permission[perm_type].keys()):
-                for item in sorted(self.permission[perm_type][id_type]):
-                    perm_data.append(f"{perm_type}:{id_type}:{item}")
-
-        for item in perm_data:
-            hash_obj.update(item.encode('utf-8'))
-
-        hash_obj.update(str(self.is_on).encode('utf-8'))
+        update = hash_obj.update
+        update(self.rule._persist_hash().to_bytes(8, byteorder='big'))
+        for tag, perm_type, id_type in _PERM_HASH_SECTIONS:
+            for item in sorted(self.permission[perm_type][id_type]):
+                update(tag)
+                update(item.encode('utf-8'))
+        update(b"\x05\x01" if self.is_on else b"\x05\x00")
         return int.from_bytes(hash_obj.digest(), byteorder='big')
 
     def __hash__(self) -> int:
-        return self._quick_hash()
+        return self._hash
+
+    def has_restriction(self) -> bool:
+        """是否可能拦截消息：已关闭(仅白名单放行)或存在黑名单"""
+        if not self.is_on:
+            return True
+        ban_list = self.permission["ban_list"]
+        return bool(ban_list["user"] or ban_list["group"])
 
     @field_serializer('permission')
     def serialize_permission(self, value: Dict[str, Dict[str, FrozenSet[str]]], _info) -> Dict[str, Dict[str, List[str]]]:
@@ -229,51 +289,50 @@ class MatcherInfo(BaseModel):
             },
         }
 
+    @field_validator("permission", mode="before")
+    @classmethod
+    def ensure_permission_frozenset(cls, v: Any) -> Dict[str, Dict[str, FrozenSet[str]]]:
+        """确保权限数据转换为不可变集合，并且结构严格符合预期"""
+        if _is_frozen_permission(v):
+            return v
 
-@field_validator("permission", mode="before")
-@classmethod
-def ensure_permission_frozenset(cls, v: Any) -> Dict[str, Dict[str, FrozenSet[str]]]:
-    """确保权限数据转换为不可变集合，并且结构严格符合预期"""
-    if isinstance(v, str):
-        try:
-            v = orjson.loads(v)
-        except orjson.JSONDecodeError:
-            raise ValueError("permission 字段不是合法的 JSON 字符串")
-
-    if not isinstance(v, dict):
-        v = {}
-
-    _ALLOWED_OUTER_KEYS = {"white_list", "ban_list"}
-    _ALLOWED_INNER_KEYS = {"user", "group"}
-
-    provided_outer_keys = set(v.keys())
-    if not provided_outer_keys.issubset(_ALLOWED_OUTER_KEYS):
-        extra_keys = provided_outer_keys - _ALLOWED_OUTER_KEYS
-        raise ValueError(
-            f"permission 只允许包含 {list(_ALLOWED_OUTER_KEYS)}，但收到了额外键: {list(extra_keys)}")
-
-    white_list = v.get("white_list", {})
-    ban_list = v.get("ban_list", {})
-
-    for name, inner_dict in [("white_list", white_list), ("ban_list", ban_list)]:
-        if not isinstance(inner_dict, dict):
-            raise ValueError(f"{name} 必须是一个字典")
-        provided_inner_keys = set(inner_dict.keys())
-        if not provided_inner_keys.issubset(_ALLOWED_INNER_KEYS):
-            extra_keys = provided_inner_keys - _ALLOWED_INNER_KEYS
+        if isinstance(v, str):
+            try:
+                v = orjson.loads(v)
+            except orjson.JSONDecodeError:
+                raise ValueError("permission 字段不是合法的 JSON 字符串")
+
+        if not isinstance(v, dict):
+            v = {}
+
+        provided_outer_keys = set(v.keys())
+        if not provided_outer_keys.issubset(_PERM_LIST_KEYS):
+            extra_keys = provided_outer_keys - _PERM_LIST_KEYS
             raise ValueError(
-                f"{name} 只允许包含 {list(_ALLOWED_INNER_KEYS)}，但收到了额外键: {list(extra_keys)}")
+                f"permission 只允许包含 {list(_PERM_LIST_KEYS)}，但收到了额外键: {list(extra_keys)}")
+
+        white_list = v.get("white_list", {})
+        ban_list = v.get("ban_list", {})
 
-    return {
-        "white_list": {
-            "user": frozenset(white_list.get("user", [])),
-            "group": frozenset(white_list.get("group", [])),
-        },
-        "ban_list": {
-            "user": frozenset(ban_list.get("user", [])),
-            "group": frozenset(ban_list.get("group", [])),
-        },
-    }
+        for name, inner_dict in (("white_list", white_list), ("ban_list", ban_list)):
+            if not isinstance(inner_dict, dict):
+                raise ValueError(f"{name} 必须是一个字典")
+            provided_inner_keys = set(inner_dict.keys())
+            if not provided_inner_keys.issubset(_PERM_ID_KEYS):
+                extra_keys = provided_inner_keys - _PERM_ID_KEYS
+                raise ValueError(
+                    f"{name} 只允许包含 {list(_PERM_ID_KEYS)}，但收到了额外键: {list(extra_keys)}")
+
+        return {
+            "white_list": {
+                "user": frozenset(white_list.get("user", [])),
+                "group": frozenset(white_list.get("group", [])),
+            },
+            "ban_list": {
+                "user": frozenset(ban_list.get("user", [])),
+                "group": frozenset(ban_list.get("group", [])),
+            },
+        }
 
 
 class PluginMatchers(BaseModel):
@@ -282,6 +341,8 @@ class PluginMatchers(BaseModel):
     rule_mapping: Dict[int, MatcherInfo] = Field(
         default_factory=dict, exclude=True)
 
+    _has_any_restriction: bool = PrivateAttr(default=False)
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @model_serializer
@@ -296,7 +357,18 @@ class PluginMatchers(BaseModel):
         rule: RuleData
     ) -> bool:
         """检查用户权限"""
-        matcher_info = self.rule_mapping.get(hash(rule))
+        if not self._has_any_restriction:
+            return True
+        return self.perm_by_hash(hash(rule), user_id, group_id)
+
+    def perm_by_hash(
+        self,
+        rule_hash: int,
+        user_id: str,
+        group_id: Optional[str]
+    ) -> bool:
+        """以预先计算的规则哈希检查用户权限"""
+        matcher_info = self.rule_mapping.get(rule_hash)
         if matcher_info is None:
             return True
         if not matcher_info.is_on:
@@ -315,17 +387,34 @@ class PluginMatchers(BaseModel):
     def rebuild_rule_mapping(self) -> None:
         """重建规则映射关系"""
         self.rule_mapping = {hash(info.rule): info for info in self.matchers}
+        self._refresh_restriction()
+
+    def _refresh_restriction(self) -> None:
+        self._has_any_restriction = any(
+            info.has_restriction() for info in self.rule_mapping.values())
 
     def add_matcher(self, matcher_info: MatcherInfo):
         """安全地添加一个 matcher 并更新映射"""
         self.matchers.add(matcher_info)
-        self.rebuild_rule_mapping()
+        self.rule_mapping[hash(matcher_info.rule)] = matcher_info
+        if matcher_info.has_restriction():
+            self._has_any_restriction = True
 
     def remove_matcher(self, matcher_info: MatcherInfo):
         """安全地移除一个 matcher 并更新映射"""
-        if matcher_info in self.matchers:
-            self.matchers.remove(matcher_info)
-            self.rebuild_rule_mapping()
+        if matcher_info not in self.matchers:
+            return
+        self.matchers.remove(matcher_info)
+        rule_hash = hash(matcher_info.rule)
+        if self.rule_mapping.get(rule_hash) is not matcher_info:
+            return
+        del self.rule_mapping[rule_hash]
+        # 同规则的其他 matcher 接替映射
+        for info in self.matchers:
+            if hash(info.rule) == rule_hash:
+                self.rule_mapping[rule_hash] = info
+                break
+        self._refresh_restriction()
 
 
 class BotPlugins(BaseModel):
@@ -377,7 +466,7 @@ class MatcherRuleModel(BaseModel):
         return "MatcherRuleModel\n" + self.model_dump_json(indent=2)
 
     @classmethod
-    def from_json(cls, json_data: str) -> "MatcherRuleModel":
+    def from_json(cls, json_data: Union[str, bytes]) -> "MatcherRuleModel":
         """从JSON数据创建模型实例"""
         data = orjson.loads(json_data)
         instance = cls.model_validate(data)
@@ -410,9 +499,10 @@ class MatcherRuleModel(BaseModel):
                         matcher_info_kwargs["permission"] = getattr(
                             matcher, "lazytea_permission")
 
-                    matcher_info = MatcherInfo(**matcher_info_kwargs)
-                    plugin_matchers.add_matcher(matcher_info)
+                    plugin_matchers.matchers.add(
+                        MatcherInfo(**matcher_info_kwargs))
 
+                plugin_matchers.rebuild_rule_mapping()
                 bot_plugins.plugins[plugin_name] = plugin_matchers
 
             model.bots[bot_id] = bot_plugins
@@ -8,7 +8,7 @@ from nonebot import get_bots, logger
 from nonebot_plugin_localstore import get_plugin_data_dir
 
 
-from .model import MatcherRuleModel, BotPlugins, PluginMatchers
+from .model import MatcherRuleModel, BotPlugins, PluginMatchers, MatcherInfo
 
 
 class FuncTeller:
@@ -74,7 +74,7 @@ class FuncTeller:
 
         target_path = cls.path
         try:
-            async with aiofiles.open(target_path, 'r', encoding='utf-8') as f:
+            async with aiofiles.open(target_path, 'rb') as f:
                 content = await f.read()
                 return MatcherRuleModel.from_json(content)
         except FileNotFoundError:
@@ -116,13 +116,9 @@ class FuncTeller:
                         }
 
                 for current_info in plugin_matchers.matchers:
-                    rule_hash = hash(current_info.rule)
-                    merged_info = current_info.model_copy(deep=True)
-
-                    if rule_hash in file_rule_infos:
-                        file_info = file_rule_infos[rule_hash]
-                        merged_info.permission = file_info["permission"]
-                        merged_info.is_on = file_info["is_on"]
+                    file_info = file_rule_infos.get(hash(current_info.rule))
+                    merged_info = MatcherInfo(
+                        rule=current_info.rule, **file_info) if file_info else current_info
 
                     merged_plugin.matchers.add(merged_info)
 